@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python
+
+# bench_inspect measures Inspector.inspect against fake UNO objects
+
+"""Benchmark suite for unoinspect.Inspector.inspect
+
+Runs inspect in dict, json and pickle modes against fake UNO objects
+(see fakeuno.py) of different shapes and sizes, at several simulated
+bridge latencies. Reports wall time, bridge calls and peak memory per
+case, and compares them with a stored baseline.
+
+    python bench_inspect.py --save-baseline     # store numbers
+    python bench_inspect.py                     # compare, exit 1 on regression
+
+The baseline is specific to the machine, it is not committed. Without
+baseline the comparison fails with exit status 2.
+    python bench_inspect.py --full -k names     # large cases with names
+
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from os.path import abspath, dirname, join
+
+_DIR = dirname(abspath(__file__))
+sys.path.insert(0, join(dirname(_DIR), "pyzoPyUNOWorkspace"))
+
+import fakeuno  # noqa: E402
+
+BRIDGE = fakeuno.install()
+
+import unoinspect  # noqa: E402
+
+# keep json and pickle results out of the package directory
+unoinspect._DIR = tempfile.mkdtemp(prefix="bench_inspect")
+
+_BASELINE_FILE = join(_DIR, "baseline.json")
+_MODES = ("dict", "json", "pickle")
+_LATENCIES = (0.0, 0.0002, 0.001)
+# absolute slack, timer noise for fast cases
+_TIME_SLACK = 0.005
+_MEMORY_SLACK = 64 * 1024
+
+# shape name: (FakeObject keyword arguments, full run only)
+SHAPES = {
+    "props-10": (dict(properties=10), False),
+    "props-100": (dict(properties=100), False),
+    "props-1000": (dict(properties=1000), False),
+    "props-5000": (dict(properties=5000), True),
+    "methods-500": (dict(properties=10, methods=500), False),
+    "names-1k": (dict(properties=10, names=1000), False),
+    "names-100k": (dict(properties=10, names=100000), False),
+    "names-1m": (dict(properties=10, names=1000000), True),
+    "index-100k": (dict(properties=10, count=100000), False),
+    "enum-1k": (dict(properties=10, enumeration=1000), False),
+    "enum-100k": (dict(properties=10, enumeration=100000), True),
+    "document": (
+        dict(properties=300, methods=200, names=1000, count=1000, enumeration=1000),
+        False,
+    ),
+}
+
+
+def caseName(shape, mode, latency):
+    return "{}/{}/{}ms".format(shape, mode, latency * 1000)
+
+
+def runCase(shape, mode, latency, repeat):
+    """Benchmark one case
+    :param shape: key of SHAPES
+    :param mode: inspect output mode
+    :param latency: bridge latency in seconds
+    :param repeat: number of timed runs, best one is reported
+    Return dict with time, calls and memory
+    """
+    kwargs, full = SHAPES[shape]
+    object = fakeuno.FakeObject("Fake" + shape, **kwargs)
+    BRIDGE.latency = latency
+
+    times = []
+    calls = 0
+    for i in range(repeat):
+        # every run starts without cached schemas
+        inspector = unoinspect.Inspector()
+        inspector.clearCache()
+        BRIDGE.reset()
+        gc.collect()
+        start = time.perf_counter()
+        inspector.inspect(object, output=mode)
+        times.append(time.perf_counter() - start)
+        calls = BRIDGE.calls
+
+    # memory in separate run, tracemalloc slows down the timing
+    BRIDGE.latency = 0.0
+    inspector = unoinspect.Inspector()
+    inspector.clearCache()
+    gc.collect()
+    tracemalloc.start()
+    inspector.inspect(object, output=mode)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"time": min(times), "calls": calls, "memory": peak}
+
+
+def compare(results, baseline, tolerance):
+    """Compare results with baseline
+    :param tolerance: allowed relative increase
+    Return list of regression messages
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        limits = {
+            "time": base["time"] * (1 + tolerance) + _TIME_SLACK,
+            "calls": base["calls"] * (1 + tolerance),
+            "memory": base["memory"] * (1 + tolerance) + _MEMORY_SLACK,
+        }
+        for key, limit in limits.items():
+            if result[key] > limit:
+                regressions.append(
+                    "{}: {} {} > baseline {}".format(name, key, result[key], base[key])
+                )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--full", action="store_true", help="include the largest cases")
+    parser.add_argument("-k", dest="select", default="", help="run cases containing text")
+    parser.add_argument("--mode", choices=_MODES, action="append", help="output mode")
+    parser.add_argument(
+        "--latency", type=float, action="append", help="bridge latency in seconds"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    parser.add_argument("--baseline", default=_BASELINE_FILE, help="baseline file")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store results as baseline"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed relative regression"
+    )
+    args = parser.parse_args(argv)
+
+    modes = args.mode or _MODES
+    latencies = args.latency or _LATENCIES
+
+    results = {}
+    print("{:<40}{:>12}{:>10}{:>12}".format("case", "time [ms]", "calls", "peak [kB]"))
+    for shape, (kwargs, full) in SHAPES.items():
+        if full and not args.full:
+            continue
+        for mode in modes:
+            for latency in latencies:
+                name = caseName(shape, mode, latency)
+                if args.select not in name:
+                    continue
+                result = runCase(shape, mode, latency, args.repeat)
+                results[name] = result
+                print(
+                    "{:<40}{:>12.1f}{:>10}{:>12.0f}".format(
+                        name, result["time"] * 1000, result["calls"], result["memory"] / 1024
+                    )
+                )
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as infile:
+                baseline = json.load(infile)
+        baseline.update(results)
+        with open(args.baseline, "w") as outfile:
+            json.dump(baseline, outfile, indent=4, sort_keys=True)
+        print("baseline stored in " + args.baseline)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("no baseline " + args.baseline + ", run with --save-baseline")
+        return 2
+
+    with open(args.baseline) as infile:
+        baseline = json.load(infile)
+    regressions = compare(results, baseline, args.tolerance)
+    for message in regressions:
+        print("REGRESSION " + message)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,522 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python
+
+# fakeuno is pure Python stand-in for the PyUNO bridge
+
+"""Pure Python stand-in for the PyUNO bridge
+
+Models UNO objects with properties and methods, name and index
+containers and enumerations, so unoinspect can run without LibreOffice.
+Every call which crosses the bridge in PyUNO is counted and delayed by
+the bridge latency, to simulate a remote office over a socket.
+
+    import fakeuno
+    bridge = fakeuno.install(latency=0.0005)
+
+    import unoinspect
+    doc = fakeuno.FakeObject("SwXTextDocument", properties=200)
+    unoinspect.Inspector().inspect(doc, output="dict")
+    print(bridge.calls)
+
+install() must be called before unoinspect is imported.
+"""
+
+import sys
+import threading
+import time
+import types
+
+# method and property concepts, parameter modes
+_CONCEPT_ALL = -1
+_PARAM_MODE_IN = 0
+_PARAM_MODE_OUT = 1
+_PARAM_MODE_INOUT = 2
+
+
+class Bridge:
+    """Count the bridge calls and simulate their latency
+
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def call(self):
+        """One call over the bridge
+        """
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def reset(self):
+        """Reset call counter
+        """
+        with self._lock:
+            self.calls = 0
+
+
+# bridge used by all fake objects, see install
+BRIDGE = Bridge()
+
+
+# -----------------------------------------------------------
+#               TYPES
+# -----------------------------------------------------------
+
+
+class RuntimeException(Exception):
+    """com.sun.star.uno.RuntimeException"""
+
+
+class DisposedException(RuntimeException):
+    """com.sun.star.lang.DisposedException"""
+
+
+class UnknownPropertyException(Exception):
+    """com.sun.star.beans.UnknownPropertyException"""
+
+
+class FakeType:
+    """uno.Type and XIdlClass"""
+
+    def __init__(self, typeName):
+        self.typeName = typeName
+        self.Name = typeName
+
+    def getName(self):
+        return self.typeName
+
+    def __repr__(self):
+        return "<Type instance {}>".format(self.typeName)
+
+
+class FakeProperty:
+    """com.sun.star.beans.Property"""
+
+    def __init__(self, name, typeName, handle=-1):
+        self.Name = name
+        self.Type = FakeType(typeName)
+        self.Handle = handle
+        self.Attributes = 0
+
+
+class FakeParamInfo:
+    """com.sun.star.reflection.ParamInfo"""
+
+    def __init__(self, name, mode=_PARAM_MODE_IN):
+        self.aName = name
+        self.aMode = mode
+
+
+class FakeMethod:
+    """XIdlMethod"""
+
+    def __init__(self, name, returnType="void", params=()):
+        self.Name = name
+        self._returnType = FakeType(returnType)
+        self.ParameterTypes = [FakeType(typ) for p_name, typ in params]
+        self.ParameterInfos = [FakeParamInfo(p_name) for p_name, typ in params]
+
+    def getReturnType(self):
+        return self._returnType
+
+
+# property values generated for the property types
+_VALUES = {
+    "string": lambda i: "Text {}".format(i),
+    "long": lambda i: i,
+    "double": lambda i: i / 4.0,
+    "boolean": lambda i: bool(i % 2),
+    "[]string": lambda i: tuple("Item {}".format(n) for n in range(8)),
+    "[][]double": lambda i: tuple(
+        tuple(float(r * 4 + c) for c in range(4)) for r in range(16)
+    ),
+    "com.sun.star.uno.XInterface": lambda i: FakeObject("FakeChild", properties=4),
+}
+_VALUE_TYPES = list(_VALUES)
+
+# methods of every fake object: name, return type, parameters
+_BASE_METHODS = [
+    ("getImplementationName", "string", ()),
+    ("supportsService", "boolean", (("ServiceName", "string"),)),
+    ("getSupportedServiceNames", "[]string", ()),
+    ("getTypes", "[]type", ()),
+    ("getPropertySetInfo", "com.sun.star.beans.XPropertySetInfo", ()),
+    ("getPropertyValue", "any", (("PropertyName", "string"),)),
+    (
+        "setPropertyValue",
+        "void",
+        (("aPropertyName", "string"), ("aValue", "any")),
+    ),
+]
+_MULTI_METHODS = [
+    ("getPropertyValues", "[]any", (("aPropertyNames", "[]string"),)),
+]
+_NAME_METHODS = [
+    ("getByName", "any", (("aName", "string"),)),
+    ("getElementNames", "[]string", ()),
+    ("hasByName", "boolean", (("aName", "string"),)),
+]
+_INDEX_METHODS = [
+    ("getByIndex", "any", (("Index", "long"),)),
+    ("getCount", "long", ()),
+]
+_ENUMERATION_METHODS = [
+    ("createEnumeration", "com.sun.star.container.XEnumeration", ()),
+]
+
+
+# -----------------------------------------------------------
+#               OBJECTS
+# -----------------------------------------------------------
+
+
+class FakeObject:
+    """UNO object as seen through PyUNO
+
+    Property values are read through attribute access, methods are
+    called as attributes. Both count as bridge calls.
+
+    """
+
+    def __init__(
+        self,
+        implementation="FakeObject",
+        properties=10,
+        methods=0,
+        names=None,
+        count=0,
+        enumeration=0,
+        multi=True,
+    ):
+        """
+        :param implementation: implementation name
+        :param properties: number of generated properties or
+                           dict name: (type name, value)
+        :param methods: number of generated extra methods
+        :param names: element names of name access, or number of names
+        :param count: number of elements of index access
+        :param enumeration: number of enumerated elements
+        :param multi: support XMultiPropertySet
+
+        """
+        d = self.__dict__
+        d["_implementation"] = implementation
+        if isinstance(properties, dict):
+            d["_properties"] = dict(properties)
+        else:
+            d["_properties"] = {}
+            for i in range(properties):
+                typ = _VALUE_TYPES[i % len(_VALUE_TYPES)]
+                d["_properties"]["Property{}".format(i)] = (typ, _VALUES[typ](i))
+        d["_properties"]["ImplementationName"] = ("string", implementation)
+
+        if isinstance(names, int):
+            names = ["Element{}".format(i) for i in range(names)]
+        d["_names"] = tuple(names) if names else ()
+        d["_count"] = count
+        d["_enumeration"] = enumeration
+        d["_multi"] = multi
+
+        interfaces = [
+            "com.sun.star.lang.XServiceInfo",
+            "com.sun.star.lang.XTypeProvider",
+            "com.sun.star.beans.XPropertySet",
+        ]
+        methods_list = list(_BASE_METHODS)
+        if multi:
+            interfaces.append("com.sun.star.beans.XMultiPropertySet")
+            methods_list += _MULTI_METHODS
+        if self._names:
+            interfaces.append("com.sun.star.container.XNameAccess")
+            methods_list += _NAME_METHODS
+        if count:
+            interfaces.append("com.sun.star.container.XIndexAccess")
+            methods_list += _INDEX_METHODS
+        if enumeration:
+            interfaces.append("com.sun.star.container.XEnumerationAccess")
+            methods_list += _ENUMERATION_METHODS
+        for i in range(methods):
+            methods_list.append(
+                ("method{}".format(i), "long", (("nValue", "long"),))
+            )
+        d["_interfaces"] = tuple(interfaces)
+        d["_methods"] = {m[0]: FakeMethod(*m) for m in methods_list}
+
+    # ----- PyUNO attribute access
+
+    def __getattr__(self, name):
+        if name in self._properties:
+            BRIDGE.call()
+            return self._properties[name][1]
+        if name in self._methods:
+            return getattr(self, "_uno_" + name, self._genericMethod)
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if name not in self._properties:
+            raise AttributeError(name)
+        BRIDGE.call()
+        self._properties[name] = (self._properties[name][0], value)
+
+    def __dir__(self):
+        return sorted(list(self._properties) + list(self._methods))
+
+    def __iter__(self):
+        enm = self._uno_createEnumeration()
+        while enm.hasMoreElements():
+            yield enm.nextElement()
+
+    def __repr__(self):
+        return "pyuno object (com.sun.star.uno.XInterface)0x{:x}{{implementationName={}}}".format(
+            id(self), self._implementation
+        )
+
+    def _genericMethod(self, *args):
+        BRIDGE.call()
+        return 0
+
+    # ----- UNO methods
+
+    def _uno_getImplementationName(self):
+        BRIDGE.call()
+        return self._implementation
+
+    def _uno_supportsService(self, name):
+        BRIDGE.call()
+        return name in self._uno_getSupportedServiceNames()
+
+    def _uno_getSupportedServiceNames(self):
+        BRIDGE.call()
+        return ("com.sun.star.fake." + self._implementation, "com.sun.star.fake.Object")
+
+    def _uno_getTypes(self):
+        BRIDGE.call()
+        return tuple(FakeType(name) for name in self._interfaces)
+
+    def _uno_getPropertySetInfo(self):
+        BRIDGE.call()
+        return FakePropertySetInfo(self._properties)
+
+    def _uno_getPropertyValue(self, name):
+        BRIDGE.call()
+        if name not in self._properties:
+            raise UnknownPropertyException(name)
+        return self._properties[name][1]
+
+    def _uno_setPropertyValue(self, name, value):
+        self.__setattr__(name, value)
+
+    def _uno_getPropertyValues(self, names):
+        BRIDGE.call()
+        # like OPropertySetHelper, unsorted names give void values
+        if list(names) != sorted(names):
+            return tuple(None for name in names)
+        for name in names:
+            if name not in self._properties:
+                raise UnknownPropertyException(name)
+        return tuple(self._properties[name][1] for name in names)
+
+    def _uno_getElementNames(self):
+        BRIDGE.call()
+        return self._names
+
+    def _uno_hasByName(self, name):
+        BRIDGE.call()
+        return name in self._names
+
+    def _uno_getByName(self, name):
+        BRIDGE.call()
+        return FakeObject("FakeElement", properties=6)
+
+    def _uno_getCount(self):
+        BRIDGE.call()
+        return self._count
+
+    def _uno_getByIndex(self, index):
+        BRIDGE.call()
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return FakeObject("FakeElement", properties=6)
+
+    def _uno_createEnumeration(self):
+        BRIDGE.call()
+        return FakeEnumeration(self._enumeration)
+
+
+class FakePropertySetInfo:
+    """XPropertySetInfo"""
+
+    def __init__(self, properties):
+        self._properties = properties
+
+    def getProperties(self):
+        BRIDGE.call()
+        return tuple(
+            FakeProperty(name, typ, handle)
+            for handle, (name, (typ, value)) in enumerate(self._properties.items())
+        )
+
+    def hasPropertyByName(self, name):
+        BRIDGE.call()
+        return name in self._properties
+
+
+class FakeEnumeration:
+    """XEnumeration over generated elements"""
+
+    def __init__(self, count):
+        self._count = count
+        self._index = 0
+
+    def hasMoreElements(self):
+        BRIDGE.call()
+        return self._index < self._count
+
+    def nextElement(self):
+        BRIDGE.call()
+        if self._index >= self._count:
+            raise RuntimeException("NoSuchElementException")
+        self._index += 1
+        return FakeObject("FakeParagraph", properties=6)
+
+
+# -----------------------------------------------------------
+#               SINGLETONS
+# -----------------------------------------------------------
+
+
+class FakeIntrospectionAccess:
+    """XIntrospectionAccess"""
+
+    def __init__(self, object):
+        self._object = object
+
+    def getProperties(self, concept):
+        BRIDGE.call()
+        return tuple(
+            FakeProperty(name, typ)
+            for name, (typ, value) in self._object._properties.items()
+        )
+
+    def getMethods(self, concept):
+        BRIDGE.call()
+        return tuple(self._object._methods.values())
+
+
+class FakeIntrospection:
+    """theIntrospection"""
+
+    def inspect(self, object):
+        BRIDGE.call()
+        if not isinstance(object, FakeObject):
+            raise RuntimeException("not a UNO object")
+        return FakeIntrospectionAccess(object)
+
+
+class FakeCoreReflection:
+    """theCoreReflection"""
+
+    def forName(self, name):
+        BRIDGE.call()
+        return FakeType(name)
+
+
+class FakeServiceDocumenter:
+    """theServiceDocumenter"""
+
+    def showServiceDocs(self, object):
+        BRIDGE.call()
+
+    def showInterfaceDoc(self, object):
+        BRIDGE.call()
+
+
+class FakeUrlResolver:
+    """UnoUrlResolver, resolves to the local context"""
+
+    def resolve(self, url):
+        BRIDGE.call()
+        return _CONTEXT
+
+
+class FakeServiceManager:
+    """ServiceManager"""
+
+    def createInstance(self, name):
+        BRIDGE.call()
+        if name == "com.sun.star.bridge.UnoUrlResolver":
+            return FakeUrlResolver()
+        raise RuntimeException("unknown service " + name)
+
+    def createInstanceWithContext(self, name, ctx):
+        return self.createInstance(name)
+
+
+class FakeComponentContext:
+    """Component context with the inspection singletons"""
+
+    def __init__(self):
+        self.ServiceManager = FakeServiceManager()
+        self._singletons = {
+            "/singletons/com.sun.star.beans.theIntrospection": FakeIntrospection(),
+            "/singletons/com.sun.star.reflection.theCoreReflection": FakeCoreReflection(),
+            "/singletons/com.sun.star.util.theServiceDocumenter": FakeServiceDocumenter(),
+        }
+
+    def getValueByName(self, name):
+        BRIDGE.call()
+        return self._singletons.get(name)
+
+    getByName = getValueByName
+
+
+_CONTEXT = FakeComponentContext()
+
+
+# -----------------------------------------------------------
+#               INSTALL
+# -----------------------------------------------------------
+
+
+def install(latency=0.0):
+    """Register fake uno and com.sun.star modules in sys.modules
+
+    :param latency: seconds added to each bridge call
+    Return Bridge with call counter
+
+    """
+    BRIDGE.latency = latency
+    BRIDGE.reset()
+
+    uno = types.ModuleType("uno")
+    uno.getComponentContext = lambda: _CONTEXT
+    sys.modules["uno"] = uno
+
+    modules = {
+        "com": {},
+        "com.sun": {},
+        "com.sun.star": {},
+        "com.sun.star.beans": {
+            "UnknownPropertyException": UnknownPropertyException,
+        },
+        "com.sun.star.beans.MethodConcept": {"ALL": _CONCEPT_ALL},
+        "com.sun.star.beans.PropertyConcept": {"ALL": _CONCEPT_ALL},
+        "com.sun.star.lang": {"DisposedException": DisposedException},
+        "com.sun.star.reflection": {},
+        "com.sun.star.reflection.ParamMode": {
+            "IN": _PARAM_MODE_IN,
+            "OUT": _PARAM_MODE_OUT,
+            "INOUT": _PARAM_MODE_INOUT,
+        },
+        "com.sun.star.uno": {"RuntimeException": RuntimeException},
+    }
+    for name, attributes in modules.items():
+        module = types.ModuleType(name)
+        module.__dict__.update(attributes)
+        sys.modules[name] = module
+
+    return BRIDGE
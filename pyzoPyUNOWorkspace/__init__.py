@@ -15,10 +15,11 @@ from pyzo.util.qt import QtCore, QtGui, QtWidgets
 from .tree import (
     PyUNOWorkspaceTree,
     PyUNOWorkspaceProxy,
+    MORE_ITEMS,
+    FILTER_ITEMS,
     writeHistory,
     readHistory,
     getHistoryFilePath,
-    createResultFile,
     createHistoryFile,
 )
 
@@ -66,6 +67,11 @@ class PyzoPyUNOWorkspace(QtWidgets.QWidget):
         #     self._config.historyFreeze = 0
         if not hasattr(self._config, "historyClearOnStartup"):
             self._config.historyClearOnStartup = 1
+        #
+        if not hasattr(self._config, "lazyValues"):
+            self._config.lazyValues = 1
+        if not hasattr(self._config, "timingStats"):
+            self._config.timingStats = 0
 
         style = QtWidgets.qApp.style()
         #
@@ -321,9 +327,6 @@ class PyzoPyUNOWorkspace(QtWidgets.QWidget):
         self._search.pressed.connect(self.onSearchPress)
         self._clear.pressed.connect(self.onClearHelpPress)
 
-        # Create json result file
-        createResultFile(),
-
         # Load History
         if self._config.historyClearOnStartup:
             #self._config.historyFreeze = 0
@@ -393,7 +396,7 @@ class PyzoPyUNOWorkspace(QtWidgets.QWidget):
         """ Refresh """
         self.onClearHelpPress()
         line = self._line.text()
-        self._tree._proxy.setName(line)
+        self._tree._proxy.setName(line, refresh=True)
 
     def onBackPress(self):
         """ Go back """
@@ -423,7 +426,9 @@ class PyzoPyUNOWorkspace(QtWidgets.QWidget):
     def onElementIndexPress(self):
         """ Fill element index in combo box """
         element = self._element_index.currentText()
-        if not element == "--Index--":
+        if element == MORE_ITEMS:
+            self._tree._proxy.requestMoreItems("getByIndex")
+        elif not element == "--Index--":
             old_line = self._line.text()
             new_line = str(old_line + ".getByIndex(" + element + ")")
             self._line.setText(new_line)
@@ -432,7 +437,15 @@ class PyzoPyUNOWorkspace(QtWidgets.QWidget):
     def onElementNamesPress(self):
         """ Fill element names in combo box """
         element = self._element_names.currentText()
-        if not element == "--Name--":
+        if element == MORE_ITEMS:
+            self._tree._proxy.requestMoreItems("getByName")
+        elif element == FILTER_ITEMS:
+            prefix, ok = QtWidgets.QInputDialog.getText(
+                self, "Filter names", "List names starting with:"
+            )
+            if ok:
+                self._tree._proxy.requestItems("getByName", prefix)
+        elif not element == "--Name--":
             old_line = self._line.text()
             new_line = str(old_line + '.getByName("' + element + '")')
             self._line.setText(new_line)
@@ -442,7 +455,11 @@ class PyzoPyUNOWorkspace(QtWidgets.QWidget):
         """ Create enumeration """
         element = self._enumerate_index.currentText()
         line = self._line.text()
-        if element == "All":
+        if element == MORE_ITEMS:
+            self._tree._proxy.requestMoreItems("createEnumeration")
+        elif element == "--Enumeration--":
+            pass
+        elif element == "All":
             new_line = "list(" + line + ")"
             self._tree._proxy.setName(new_line)
         else:
@@ -454,7 +471,7 @@ class PyzoPyUNOWorkspace(QtWidgets.QWidget):
         """ Back to history """
         new_line = self._history.currentText()
         self._line.setText(new_line)
-        self._tree._proxy.setName(new_line)
+        self._tree._proxy.setName(new_line, cached=True)
 
     def onHelpTogglePress(self):
         """ Open or close new project widget. """
@@ -551,16 +568,28 @@ class PyzoPyUNOWorkspace(QtWidgets.QWidget):
         menu = self._options._menu
         menu.clear()
 
-        # Always clear the shell screen
+        # Lazy property values
         menu.addCheckItem(
             pyzo.translate(
                 "pyzoWorkspace",
-                "Clear shell ::: Always clear the shell screen after new command.",
+                "Lazy values ::: Load property values of the visible rows only.",
             ),
             icon=None,
-            callback=self.onClearShell,
+            callback=self.onLazyValues,
             value=None,
-            selected=self._config.clearScreenAfter,
+            selected=self._config.lazyValues,
+        )
+
+        # Timing of the inspection
+        menu.addCheckItem(
+            pyzo.translate(
+                "pyzoWorkspace",
+                "Timing stats ::: Show the slowest members in the help.",
+            ),
+            icon=None,
+            callback=self.onTimingStats,
+            value=None,
+            selected=self._config.timingStats,
         )
 
         menu.addSeparator()
@@ -676,12 +705,19 @@ class PyzoPyUNOWorkspace(QtWidgets.QWidget):
             self._config.hideTypes.append(type)
 
         # Update
-        self._tree.fillWorkspace()
+        self._tree.updateFilter()
+
+    def onLazyValues(self, value):
 
-    def onClearShell(self, value):
+        self._config.lazyValues = value
 
-        self._config.clearScreenAfter = value
+    def onTimingStats(self, value):
 
+        self._config.timingStats = value
+        # the stats are shown in the help
+        if value:
+            self._btn_toggle.setChecked(True)
+        self._tree._proxy.requestData()
 
     def onFontHelpOptionMenuTiggered(self, action):
         """  The user decides about font size in the Help. """
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+# PyUNO Workspace jobs of the kernel session
+import pyzo
+from pyzo.util.qt import QtCore
+from .utils import sessionExpression
+
+
+# Milliseconds between the polls for finished jobs
+POLL_INTERVAL = 30
+
+
+class KernelJob:
+    """ KernelJob
+
+    Job on the worker thread of the kernel inspection session. The job
+    is passed to its callback once, with the interface of the pyzo
+    request futures: cancelled(), exception() and result().
+
+    """
+
+    def __init__(self, shell, callback):
+        self.shell = shell
+        self.id = None
+        self._callback = callback
+        self._finished = False
+        self._cancelled = False
+        self._exception = None
+        self._result = None
+
+    def cancelled(self):
+        return self._cancelled
+
+    def exception(self):
+        return self._exception
+
+    def result(self):
+        return self._result
+
+    def done(self):
+        return self._finished
+
+    def finish(self):
+        """ finish()
+        Pass the job to the callback, once.
+        """
+        if not self._finished:
+            self._finished = True
+            self._callback(self)
+
+
+class KernelJobs(QtCore.QObject):
+    """ KernelJobs
+
+    Submit jobs to the inspection session of the shell's kernel, see
+    unoinspect.InspectionSession, and poll for their results while
+    jobs are pending.
+
+    """
+
+    def __init__(self):
+        QtCore.QObject.__init__(self)
+
+        # shell: {job id: job}
+        self._pending = {}
+        # shells with a poll on the way
+        self._polling = set()
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(POLL_INTERVAL)
+        self._timer.timeout.connect(self.poll)
+
+    def submit(self, callback, method, *args, **kwargs):
+        """ submit(callback, method, *args, **kwargs)
+        Run Inspector method in the kernel, return job.
+        """
+        return self._submit(callback, sessionExpression("submit", method, *args, **kwargs))
+
+    def submitPath(self, callback, method, path, *args, **kwargs):
+        """ submitPath(callback, method, path, *args, **kwargs)
+        Run Inspector method with the object of path in the kernel,
+        return job.
+        """
+        return self._submit(
+            callback, sessionExpression("submitPath", method, path, *args, **kwargs)
+        )
+
+    def prefetch(self, callback, path, **kwargs):
+        """ prefetch(callback, path, **kwargs)
+        Inspect the object of path in the kernel when no other job is
+        queued, with a bridge call budget, return job.
+        """
+        return self._submit(callback, sessionExpression("prefetch", path, **kwargs))
+
+    def _submit(self, callback, expression):
+        shell = pyzo.shells.getCurrentShell()
+        job = KernelJob(shell, callback)
+        if not shell:
+            # after the caller tagged the job, the lambda keeps it alive
+            job._cancelled = True
+            QtCore.QTimer.singleShot(0, lambda: job.finish())
+            return job
+
+        future = shell._request.eval(expression)
+        future.add_done_callback(lambda future: self._onSubmitted(job, future))
+        return job
+
+    def _onSubmitted(self, job, future):
+        """ _onSubmitted(job, future)
+        The kernel queued the job, poll for it.
+        """
+        if future.cancelled():
+            job._cancelled = True
+        elif future.exception():
+            job._exception = future.exception()
+        elif not isinstance(future.result(), int):
+            # error message of the kernel
+            job._exception = RuntimeError(future.result())
+        else:
+            job.id = future.result()
+            if job._cancelled:
+                self._cancelIds(job.shell, [job.id])
+                return
+            self._pending.setdefault(job.shell, {})[job.id] = job
+            if not self._timer.isActive():
+                self._timer.start()
+            return
+
+        job.finish()
+
+    def cancel(self, job):
+        """ cancel(job)
+        Cancel the job, in the kernel too if it is queued there.
+        """
+        if job.done():
+            return
+
+        job._cancelled = True
+        if job.id is not None:
+            self._pending.get(job.shell, {}).pop(job.id, None)
+            self._cancelIds(job.shell, [job.id])
+        job.finish()
+
+    def _cancelIds(self, shell, ids):
+        shell._request.eval(sessionExpression("cancel", ids))
+
+    def poll(self):
+        """ poll()
+        Ask the kernels for the finished jobs.
+        """
+        for shell, jobs in list(self._pending.items()):
+            if not jobs:
+                del self._pending[shell]
+            elif shell not in self._polling:
+                self._polling.add(shell)
+                future = shell._request.eval(sessionExpression("poll", list(jobs)))
+                future.add_done_callback(
+                    lambda future, shell=shell: self._onPolled(shell, future)
+                )
+
+        if not self._pending:
+            self._timer.stop()
+
+    def _onPolled(self, shell, future):
+        """ _onPolled(shell, future)
+        Pass the finished jobs to their callbacks.
+        """
+        self._polling.discard(shell)
+        jobs = self._pending.get(shell, {})
+
+        records = None
+        if future.cancelled():
+            pass  # No living kernel
+        elif future.exception():
+            print("Kernel-jobs-exception: ", future.exception())
+        elif not isinstance(future.result(), list):
+            # error message of the kernel
+            print("Kernel-jobs-exception: ", future.result())
+        else:
+            records = future.result()
+
+        if records is None:
+            # the jobs are lost
+            for job in jobs.values():
+                job._cancelled = True
+                job.finish()
+            jobs.clear()
+            return
+
+        for record in records:
+            job = jobs.pop(record["job"], None)
+            if job is None:
+                continue
+            if record["error"] in ("cancelled", "unknown"):
+                job._cancelled = True
+            elif record["error"]:
+                job._exception = RuntimeError(record["error"])
+            else:
+                job._result = record["result"]
+            job.finish()
+
+
+_JOBS = None
+
+
+def kernelJobs():
+    """ kernelJobs()
+    Return the jobs of the workspace, created on first use.
+    """
+    global _JOBS
+    if _JOBS is None:
+        _JOBS = KernelJobs()
+    return _JOBS
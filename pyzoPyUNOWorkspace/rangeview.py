@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# PyUNO Workspace cell range view
+from collections import OrderedDict
+
+from pyzo.util.qt import QtCore, QtWidgets
+from .jobs import kernelJobs
+
+
+# Rows read per request, same as unoinspect._RANGE_BLOCK
+BLOCK_ROWS = 200
+# Number of blocks kept in the cache
+CACHED_BLOCKS = 50
+# Text of the cells which are not read yet
+LOADING = "..."
+
+
+def columnName(column):
+    """ Return Calc column name of zero based column, eg. 27 -> 'AB'. """
+    name = ""
+    column += 1
+    while column:
+        column, rest = divmod(column - 1, 26)
+        name = chr(ord("A") + rest) + name
+    return name
+
+
+class RangeModel(QtCore.QAbstractTableModel):
+    """ RangeModel
+
+    Table model of a Calc cell range in the shell. The cells are read
+    with getDataArray or getFormulaArray in blocks of rows, only for
+    the rows the view asks for, and the blocks are cached.
+
+    """
+
+    def __init__(self, name, formulas=False, parent=None):
+        QtCore.QAbstractTableModel.__init__(self, parent)
+
+        # Range expression and the read array
+        self._name = name
+        self._formulas = formulas
+
+        # Size and position of the range
+        self._rows = 0
+        self._columns = 0
+        self._row = 0
+        self._column = 0
+
+        # Block index: rows, least recently used first
+        self._blocks = OrderedDict()
+        self._pending = set()
+
+        self.requestInfo()
+
+    def requestInfo(self):
+        """ requestInfo()
+        Request size and position of the range.
+        """
+        kernelJobs().submitPath(self.processInfo, "rangeInfo", self._name)
+
+    def processInfo(self, future):
+        """ processInfo(future)
+        We got the size of the range, show empty table.
+        """
+        if future.cancelled():
+            return
+        elif future.exception():
+            print("Range-info-exception: ", future.exception())
+            return
+
+        response = future.result()
+        if not isinstance(response, dict):
+            print("Range-info-exception: ", response)
+            return
+
+        self.beginResetModel()
+        self._rows = response["rows"]
+        self._columns = response["columns"]
+        self._row = response["row"]
+        self._column = response["column"]
+        self._blocks.clear()
+        self._pending.clear()
+        self.endResetModel()
+
+    def requestBlock(self, block):
+        """ requestBlock(block)
+        Read the rows of the block, once.
+        """
+        if block in self._pending:
+            return
+
+        self._pending.add(block)
+        job = kernelJobs().submitPath(
+            self.processBlock,
+            "rangeBlock",
+            self._name,
+            block * BLOCK_ROWS,
+            BLOCK_ROWS,
+            formulas=self._formulas,
+        )
+        job._pyuno_block = block
+
+    def processBlock(self, future):
+        """ processBlock(future)
+        We got the rows of the block, cache them and update the view.
+        """
+        block = future._pyuno_block
+        self._pending.discard(block)
+
+        if future.cancelled():
+            return
+        elif future.exception():
+            print("Range-block-exception: ", future.exception())
+            return
+
+        response = future.result()
+        if not isinstance(response, dict) or not response["rows"]:
+            return
+
+        self._blocks[block] = response["rows"]
+        while len(self._blocks) > CACHED_BLOCKS:
+            self._blocks.popitem(last=False)
+
+        first = response["start"]
+        last = first + len(response["rows"]) - 1
+        self.dataChanged.emit(
+            self.index(first, 0), self.index(last, self._columns - 1)
+        )
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._columns
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+
+        block, row = divmod(index.row(), BLOCK_ROWS)
+        rows = self._blocks.get(block)
+        if rows is None:
+            self.requestBlock(block)
+            return LOADING
+
+        self._blocks.move_to_end(block)
+        if row < len(rows) and index.column() < len(rows[row]):
+            return rows[row][index.column()]
+        return ""
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Horizontal:
+            return columnName(self._column + section)
+        return str(self._row + section + 1)
+
+
+class RangeView(QtWidgets.QDialog):
+    """ RangeView
+
+    Window with the cells of a Calc range in a virtual table, scrolling
+    reads only the blocks of the visible rows.
+
+    """
+
+    def __init__(self, name, formulas=False, parent=None):
+        QtWidgets.QDialog.__init__(self, parent)
+
+        if formulas:
+            self.setWindowTitle(name + " - FormulaArray")
+        else:
+            self.setWindowTitle(name + " - DataArray")
+        self.resize(800, 500)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+
+        # Table
+        self._model = RangeModel(name, formulas, self)
+        self._table = QtWidgets.QTableView(self)
+        self._table.setModel(self._model)
+        self._table.setWordWrap(False)
+        self._table.verticalHeader().setDefaultSectionSize(
+            self._table.fontMetrics().height() + 4
+        )
+
+        # Layouts
+        mainLayout = QtWidgets.QVBoxLayout(self)
+        mainLayout.addWidget(self._table, 1)
+        self.setLayout(mainLayout)
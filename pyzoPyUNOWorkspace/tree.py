@@ -1,15 +1,25 @@
+import bisect
+from collections import OrderedDict
 import configparser
+import html
 from inspect import getsourcefile
-from json import load
 import os
 import re
 import sqlite3
+import time
 import webbrowser
 
 import pyzo
 from pyzo import translate
 from pyzo.util.qt import QtCore, QtGui, QtWidgets
-from .utils import splitName, splitNameCleaner, joinName
+from .utils import (
+    splitName,
+    splitNameCleaner,
+    joinName,
+    sessionCall,
+)
+from .jobs import kernelJobs
+from .rangeview import RangeView
 
 
 # Constants
@@ -41,30 +51,56 @@ SNIPPET_SUFIX = config.get("GENERAL", "snippet_sufix")
 # connect documentation database
 conn = sqlite3.connect(UNODOC_DB)
 
-# JSON serialization path
-RESULTFILE_JSON = "result.txt"
-RESULT_JSON = os.path.join(WORKSPACE_DIR, RESULTFILE_JSON)
-# Pickle path
-RESULTFILE_PICKLE = "result.pkl"
-RESULT_PICKLE = os.path.join(WORKSPACE_DIR, RESULTFILE_PICKLE)
 # History file
 HISTORYFILE = "ws_history.txt"
 HISTORY = os.path.join(WORKSPACE_DIR, HISTORYFILE)
 DIALOG_INPUT = []
-
-
-# Result file
-def createResultFile():
-
-    if os.path.exists(RESULT_JSON):
-        os.remove(RESULT_JSON)
-
-    with open(RESULT_JSON, "w") as f:
-        f.write('{}')
-
-
-def getResultFilePath():
-    return  RESULT_JSON
+# Property value not fetched yet, same as unoinspect.LAZY_REPR
+LAZY_REPR = "< ... >"
+# Combo box entry to list the next page of items
+MORE_ITEMS = "--More--"
+# Combo box entry to list the names with prefix
+FILTER_ITEMS = "--Filter--"
+# Milliseconds to wait for more navigation before the request is sent
+REQUEST_DELAY = 60
+# Number of inspection results kept for Back and History
+CACHE_SIZE = 32
+# Seconds an inspection result is shown from the cache
+CACHE_AGE = 300
+# Number of likely next objects inspected in advance
+PREFETCH_COUNT = 4
+# Milliseconds a result is shown before the prefetch starts
+PREFETCH_DELAY = 500
+# Repr of UNO objects, see unoinspect._BoundedRepr
+PYUNO_REPR = "pyuno object"
+# Cell texts sorted by value, numbers and indexes like [12]
+NUMBER = re.compile(r"\[*([-+]?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)\]*$")
+NUMBER_START = frozenset("[+-0123456789")
+# Digit runs compared as numbers in natural order
+DIGITS = re.compile(r"(\d+)")
+# Variables of the shell hidden with 'startup', as pyzo's workspace
+STARTUP_VARIABLES = frozenset(("In", "Out", "exit", "get_ipython", "quit"))
+
+
+# Inspection result
+def unpackResult(result):
+    """ Unpack the compact inspection result, see unoinspect.compact. """
+    uno_dict = {}
+    if not isinstance(result, dict):
+        return uno_dict
+
+    for name, typ, kind, rep, source in result.get("rows", ()):
+        uno_dict[name] = {
+            "type": typ,
+            "kind": kind,
+            "repr": rep,
+            "source": source,
+            "items": [],
+        }
+    for name, items in result.get("items", {}).items():
+        uno_dict[name].update(items)
+
+    return uno_dict
 
 
 # History file
@@ -142,15 +178,320 @@ def formatReference(signature, description, bold=[]):
     return signature, description
 
 
-class PyUNOWorkspaceItem(QtWidgets.QTreeWidgetItem):
-    def __lt__(self, otherItem):
-        column = self.treeWidget().sortColumn()
-        try:
-            return float(self.text(column).strip("[]")) > float(
-                otherItem.text(column).strip("[]")
+def sortKey(text):
+    """ Return the sort key of a cell text. Numbers and indexes like [12]
+    sort by value, before the other texts, which sort in natural order:
+    Sheet2 before Sheet10.
+    """
+    if text[:1] in NUMBER_START:
+        number = NUMBER.match(text)
+        if number:
+            return (0, float(number.group(1)), (), text)
+    parts = DIGITS.split(text)
+    if len(parts) > 1:
+        parts[1::2] = map(int, parts[1::2])
+    return (1, 0.0, tuple(parts), text)
+
+
+class PyUNOWorkspaceModel(QtCore.QAbstractTableModel):
+    """ PyUNOWorkspaceModel
+
+    The rows of the workspace, stored column by column: a list of names,
+    types, reprs and kinds instead of an item object per row, and the
+    sort keys of the shown columns, see sortKey, computed once when a
+    cell is stored. The rows are kept in the sorted order, sorting
+    compares the keys only and new rows are inserted at their place.
+
+    """
+
+    HEADERS = ["Name", "Type", "Repr"]
+
+    def __init__(self, parent=None):
+        QtCore.QAbstractTableModel.__init__(self, parent)
+
+        # Columns
+        self._names = []
+        self._types = []
+        self._reprs = []
+        self._kinds = []
+        # Sort keys of names, types and reprs
+        self._keys = ([], [], [])
+
+        # Row by name, the rows are counted again by rowIndex after
+        # rows were inserted before others
+        self._rows = {}
+        self._rows_stale = False
+
+        # No sorting yet
+        self._sort_column = -1
+        self._sort_order = QtCore.Qt.AscendingOrder
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+        return self.column(index.column())[index.row()]
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def column(self, column):
+        """ column(column)
+        Return the list of names, types or reprs of the column.
+        """
+        return (self._names, self._types, self._reprs)[column]
+
+    def row(self, row):
+        """ row(row)
+        Return name, type, repr and kind of the row.
+        """
+        return self._names[row], self._types[row], self._reprs[row], self._kinds[row]
+
+    def setRows(self, rows):
+        """ setRows(rows)
+        Replace all rows by the list of (name, type, repr, kind).
+        """
+        self.beginResetModel()
+        self._names = [row[0] for row in rows]
+        self._types = [row[1] for row in rows]
+        self._reprs = [row[2] for row in rows]
+        self._kinds = [row[3] for row in rows]
+        self._keys = tuple(
+            [sortKey(text) for text in column]
+            for column in (self._names, self._types, self._reprs)
+        )
+        self._sortRows()
+        self.endResetModel()
+
+    def rowIndex(self):
+        """ rowIndex()
+        Return the dict name: row.
+        """
+        if self._rows_stale:
+            self._rows = {name: i for i, name in enumerate(self._names)}
+            self._rows_stale = False
+        return self._rows
+
+    def mergeRows(self, rows):
+        """ mergeRows(rows)
+        Make the rows equal to the list of (name, type, repr, kind):
+        remove and insert rows in batches and update the changed cells,
+        the other rows stay as they are.
+        """
+        names = {row[0] for row in rows}
+        removed = sorted(
+            (i for name, i in self.rowIndex().items() if name not in names),
+            reverse=True,
+        )
+
+        # remove runs of adjacent rows, from the last one
+        while removed:
+            last = first = removed.pop(0)
+            while removed and removed[0] == first - 1:
+                first = removed.pop(0)
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            for column in (self._names, self._types, self._reprs, self._kinds):
+                del column[first : last + 1]
+            for column in self._keys:
+                del column[first : last + 1]
+            self.endRemoveRows()
+        self._rows = {name: i for i, name in enumerate(self._names)}
+        self._rows_stale = False
+
+        self.updateRows(rows)
+
+    def updateRows(self, rows):
+        """ updateRows(rows)
+        Update the changed rows of the known names, insert the others.
+        """
+        new = []
+        changed = False
+        for name, typ, rep, kind in rows:
+            if name not in self._rows:
+                new.append((name, typ, rep, kind))
+                continue
+            i = self.rowIndex()[name]
+            if (typ, rep, kind) != (self._types[i], self._reprs[i], self._kinds[i]):
+                self._types[i] = typ
+                self._reprs[i] = rep
+                self._kinds[i] = kind
+                self._keys[1][i] = sortKey(typ)
+                self._keys[2][i] = sortKey(rep)
+                changed = True
+                self.dataChanged.emit(self.index(i, 1), self.index(i, 2))
+
+        if new:
+            self.insertSorted(new)
+        if changed and self._sort_column > 0 and not self.isSorted():
+            self.sort(self._sort_column, self._sort_order)
+
+    def insertSorted(self, rows):
+        """ insertSorted(rows)
+        Insert the new rows at their place in the sort order: the rows
+        are sorted on their own and inserted run by run at the bisected
+        rows, the stored rows are not sorted again.
+        """
+        keys = [tuple(sortKey(text) for text in row[:3]) for row in rows]
+        count = len(self._names)
+        if self._sort_column < 0:
+            places = [count] * len(rows)
+        else:
+            column = self._sort_column
+            order = sorted(
+                range(len(rows)),
+                key=lambda i: keys[i][column],
+                reverse=self._reverse(),
+            )
+            rows = [rows[i] for i in order]
+            keys = [keys[i] for i in order]
+            places = [self._place(key[column]) for key in keys]
+
+        # insert the runs of rows with the same place, from the last one
+        end = len(rows)
+        while end:
+            start = end - 1
+            place = places[start]
+            while start and places[start - 1] == place:
+                start -= 1
+            run = rows[start:end]
+            self.beginInsertRows(QtCore.QModelIndex(), place, place + len(run) - 1)
+            self._names[place:place] = [row[0] for row in run]
+            self._types[place:place] = [row[1] for row in run]
+            self._reprs[place:place] = [row[2] for row in run]
+            self._kinds[place:place] = [row[3] for row in run]
+            for i, column in enumerate(self._keys):
+                column[place:place] = [key[i] for key in keys[start:end]]
+            self.endInsertRows()
+            end = start
+
+        if places[0] == count:
+            # appended, the other rows keep their row
+            for i, row in enumerate(rows, count):
+                self._rows[row[0]] = i
+        else:
+            self._rows.update((row[0], -1) for row in rows)
+            self._rows_stale = True
+
+    def _place(self, key):
+        """ _place(key)
+        Return the row where a row with the sort key is inserted, after
+        the rows with equal keys.
+        """
+        keys = self._keys[self._sort_column]
+        if not self._reverse():
+            return bisect.bisect_right(keys, key)
+        low, high = 0, len(keys)
+        while low < high:
+            middle = (low + high) // 2
+            if key > keys[middle]:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def setReprs(self, reprs):
+        """ setReprs(reprs)
+        Update the repr column, reprs is a dict name: repr.
+        """
+        for name, rep in reprs.items():
+            i = self.rowIndex().get(name)
+            if i is not None:
+                self._reprs[i] = rep
+                self._keys[2][i] = sortKey(rep)
+                index = self.index(i, 2)
+                self.dataChanged.emit(index, index)
+
+        if self._sort_column == 2 and not self.isSorted():
+            self.sort(self._sort_column, self._sort_order)
+
+    def _reverse(self):
+        # reversed, the view shows the names from A to Z with the
+        # descending sort indicator of the header
+        return self._sort_order == QtCore.Qt.AscendingOrder
+
+    def isSorted(self):
+        """ isSorted()
+        Return True if the rows are in the sort order.
+        """
+        if self._sort_column < 0:
+            return True
+        keys = self._keys[self._sort_column]
+        if self._reverse():
+            return all(a >= b for a, b in zip(keys, keys[1:]))
+        return all(a <= b for a, b in zip(keys, keys[1:]))
+
+    def _sortRows(self):
+        """ _sortRows()
+        Put the stored rows in the sort order.
+        """
+        if self._sort_column >= 0:
+            keys = self._keys[self._sort_column]
+            order = sorted(
+                range(len(keys)), key=keys.__getitem__, reverse=self._reverse()
             )
-        except ValueError:
-            return self.text(column) > otherItem.text(column)
+            self._names = [self._names[i] for i in order]
+            self._types = [self._types[i] for i in order]
+            self._reprs = [self._reprs[i] for i in order]
+            self._kinds = [self._kinds[i] for i in order]
+            self._keys = tuple([column[i] for i in order] for column in self._keys)
+        self._rows = {name: i for i, name in enumerate(self._names)}
+        self._rows_stale = False
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        names = [self._names[index.row()] for index in old]
+
+        self._sort_column = column
+        self._sort_order = order
+        self._sortRows()
+
+        self.changePersistentIndexList(
+            old,
+            [
+                self.index(self._rows[name], index.column())
+                for name, index in zip(names, old)
+            ],
+        )
+        self.layoutChanged.emit()
+
+
+class PyUNOWorkspaceSortModel(QtCore.QSortFilterProxyModel):
+    """ PyUNOWorkspaceSortModel
+
+    Hides the rows of the kinds in config.hideTypes, the private names
+    and the shell's startup variables. Sorting is passed
+    on to the PyUNOWorkspaceModel, which sorts by its precomputed keys
+    instead of calling lessThan for each comparison.
+
+    """
+
+    def __init__(self, config, parent=None):
+        QtCore.QSortFilterProxyModel.__init__(self, parent)
+        self._config = config
+
+    def filterAcceptsRow(self, row, parent):
+        hide = self._config.hideTypes
+        if not hide:
+            return True
+        name, typ, rep, kind = self.sourceModel().row(row)
+        if kind in hide:
+            return False
+        if name.startswith("_") and "private" in hide:
+            return False
+        if name in STARTUP_VARIABLES and "startup" in hide:
+            return False
+        return True
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
 
 
 class PyUNOWorkspaceProxy(QtCore.QObject):
@@ -163,22 +504,52 @@ class PyUNOWorkspaceProxy(QtCore.QObject):
     """
 
     haveNewData = QtCore.Signal()
+    haveNewValues = QtCore.Signal(dict)
+    haveMoreItems = QtCore.Signal(str, dict, bool)
+    haveNewRows = QtCore.Signal(list)
+    haveStats = QtCore.Signal(dict)
 
     def __init__(self):
         QtCore.QObject.__init__(self)
 
-        # Variables
-        self._variables = []
+        # Records of the UNO members and the Python attributes
         self._uno_dict = {}
 
         # Element to get more info of
         self._name = ""
 
-        # Bind to events
-        # self._variables = []
-
-        # Element to get more info of
-        self._name = ""
+        # Id of the latest request, is its first response shown
+        self._request_id = 0
+        self._shown = False
+        # Name of the shown data, the result of a new request of this
+        # name is collected in _next and replaces the data at once
+        self._shown_name = None
+        self._next = None
+
+        # Kernel jobs of the latest request, cancelled when superseded
+        self._jobs = []
+
+        # A burst of navigation is sent as one request
+        self._refresh = False
+        self._request_timer = QtCore.QTimer(self)
+        self._request_timer.setSingleShot(True)
+        self._request_timer.setInterval(REQUEST_DELAY)
+        self._request_timer.timeout.connect(self.onRequestTimer)
+
+        # Results by (shell, name), least recently used first
+        self._cache = OrderedDict()
+        # Parts of the latest request not received yet, did one fail
+        self._waiting = set()
+        self._failed = False
+        self._request_shell = None
+
+        # Names to inspect in advance and the running prefetch
+        self._prefetch = []
+        self._prefetch_jobs = []
+        self._prefetch_timer = QtCore.QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(PREFETCH_DELAY)
+        self._prefetch_timer.timeout.connect(self.startPrefetch)
 
         # Bind to events
         pyzo.shells.currentShellChanged.connect(self.onCurrentShellChanged)
@@ -197,37 +568,341 @@ class PyUNOWorkspaceProxy(QtCore.QObject):
         parts.append(part)
         self.setName(joinName(parts))
 
-    def setName(self, name):
-        """ setName(name)
+    def setName(self, name, refresh=False, cached=False):
+        """ setName(name, refresh=False, cached=False)
         Set the name that we want to know more of.
+        Refresh evaluates all parts of the name again,
+        cached shows the recent result of the name if there is one.
         """
 
         self._name = name
+        if not refresh and self.showCached(cached):
+            return
+        self.scheduleRequest(refresh)
+
+    def showCached(self, cached=True):
+        """ showCached(cached=True)
+        Show the cached result of the name, return True if it was found.
+        Without cached only a prefetched result is shown, once.
+        """
         shell = pyzo.shells.getCurrentShell()
-        if shell:
-            # via unoinspect
-            if not self._name or self._name.endswith(".value"):
-                createResultFile()
-            else:
-                shell.executeCommand(
-                     "Inspector().inspect(" + str(self._name) + ")\n")
-            # via pyzo
-            future = shell._request.dir2(self._name)
-            future.add_done_callback(self.processResponse)
+        entry = self._cache.get((shell, self._name))
+        if entry is None or not (cached or entry["prefetched"]):
+            return False
+        elif time.monotonic() - entry["time"] > CACHE_AGE:
+            del self._cache[(shell, self._name)]
+            return False
+
+        # Like a finished request
+        self._request_timer.stop()
+        self._refresh = False
+        self._request_id += 1
+        self.cancelJobs()
+        self._waiting = set()
+        self._next = None
+        self._cache.move_to_end((shell, self._name))
+        entry["prefetched"] = False
+
+        self._uno_dict = entry["uno_dict"]
+        self._shown = True
+        self._shown_name = self._name
+        self.haveNewData.emit()
+        self._prefetch_timer.start()
+        return True
+
+    def storeCached(self, shell, name, uno_dict, prefetched=False):
+        """ storeCached(shell, name, uno_dict, prefetched=False)
+        Keep the complete result of a request or a prefetch.
+        """
+        self._cache[(shell, name)] = {
+            "time": time.monotonic(),
+            "uno_dict": uno_dict,
+            "prefetched": prefetched,
+        }
+        self._cache.move_to_end((shell, name))
+        while len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def clearCached(self, shell=None):
+        """ clearCached(shell=None)
+        Forget the results of the shell, or of all shells.
+        """
+        for key in list(self._cache):
+            if shell is None or key[0] is shell:
+                del self._cache[key]
+
+    def scheduleRequest(self, refresh=False):
+        """ scheduleRequest(refresh=False)
+        Request data when no other request follows within REQUEST_DELAY.
+        A refresh in the burst refreshes the last request.
+        """
+        self._refresh = self._refresh or refresh
+        self._request_timer.start()
+        self.cancelPrefetch()
+
+    def onRequestTimer(self):
+        """ onRequestTimer()
+        The burst is over, request data of the current name.
+        """
+        refresh = self._refresh
+        self._refresh = False
+        self.requestData(refresh)
+
+    def cancelJobs(self):
+        """ cancelJobs()
+        Cancel the kernel jobs of the superseded request.
+        """
+        jobs = kernelJobs()
+        for job in self._jobs:
+            jobs.cancel(job)
+        self._jobs = []
+        self.cancelPrefetch()
+
+    def addJob(self, job):
+        """ addJob(job)
+        Mark the job as part of the latest request.
+        """
+        job._pyuno_request = self._request_id
+        if not job.done():
+            self._jobs.append(job)
+        return job
+
+    def prefetchCandidates(self):
+        """ prefetchCandidates()
+        Return the names likely inspected next, which are not cached.
+        """
+        names = []
+        uno_dict = self._uno_dict
+
+        items = uno_dict.get("getByIndex", {}).get("items")
+        if items:
+            names.append(self._name + ".getByIndex(" + items[0] + ")")
+        items = uno_dict.get("getByName", {}).get("items")
+        if items:
+            names.append(self._name + '.getByName("' + items[0] + '")')
+        # not getCurrentSelection(), the user selects after the prefetch
+        for name, entry in sorted(uno_dict.items()):
+            if entry["kind"] == "uno_property" and entry["repr"] == PYUNO_REPR:
+                names.append(joinName(splitName(self._name) + [name]))
+
+        shell = pyzo.shells.getCurrentShell()
+        names = [name for name in names if (shell, name) not in self._cache]
+        return names[:PREFETCH_COUNT]
+
+    def startPrefetch(self):
+        """ startPrefetch()
+        The result is shown for a while, inspect the likely next names.
+        """
+        if self._name and not self._name.endswith(".value"):
+            self._prefetch = self.prefetchCandidates()
+            self.prefetchNext()
+
+    def prefetchNext(self):
+        """ prefetchNext()
+        Inspect the next likely name in the kernel, one at a time.
+        """
+        if not pyzo.shells.getCurrentShell():
+            return
+
+        while self._prefetch:
+            name = self._prefetch.pop(0)
+            job = kernelJobs().prefetch(
+                self.processPrefetch, name, request=self._request_id
+            )
+            if not job.done():
+                job._pyuno_request = self._request_id
+                job._pyuno_name = name
+                self._prefetch_jobs.append(job)
+                return
+
+    def cancelPrefetch(self):
+        """ cancelPrefetch()
+        Stop inspecting in advance, the user goes elsewhere.
+        """
+        self._prefetch_timer.stop()
+        self._prefetch = []
+        jobs = kernelJobs()
+        for job in self._prefetch_jobs:
+            jobs.cancel(job)
+        self._prefetch_jobs = []
+
+    def processPrefetch(self, future):
+        """ processPrefetch(future)
+        The kernel inspected a likely name, cache it and go on with the
+        next name.
+        """
+        if future.cancelled() or future._pyuno_request != self._request_id:
+            return
+
+        response = None if future.exception() else future.result()
+        shell = pyzo.shells.getCurrentShell()
+        if shell and isinstance(response, dict):
+            self.storeCached(
+                shell, future._pyuno_name, unpackResult(response), prefetched=True
+            )
+        # else over budget or not an object
+        self.prefetchNext()
+
+    def requestData(self, refresh=False):
+        """ requestData(refresh=False)
+        Request the records of the name, the kernel merges the Python
+        attributes with the UNO inspection.
+        """
+        self._request_timer.stop()
+        shell = pyzo.shells.getCurrentShell()
+        if not shell:
+            return
+
+        # Responses of older requests are dropped
+        self._request_id += 1
+        self.cancelJobs()
+        self._request_shell = shell
+        self._waiting = {"uno_dict"}
+        self._failed = False
+
+        # The shown rows of the name stay until the new ones are complete
+        if self._shown and self._name == self._shown_name:
+            self._next = {}
+        else:
+            self._next = None
+        self._shown = False
+
+        # via unoinspect, streamed batch by batch
+        config = pyzo.config.tools.pyzopyunoworkspace
+        if config.lazyValues:
+            values = "lazy"
+        else:
+            values = "eager"
+        job = kernelJobs().submit(
+            self.processResponse,
+            "streamPath",
+            self._name,
+            refresh=refresh,
+            values=values,
+            request=self._request_id,
+            stats=bool(config.timingStats),
+            uno=not self._name.endswith(".value"),
+        )
+        self.addJob(job)
+
+    def requestBatch(self, token):
+        """ requestBatch(token)
+        Request the next batch of the streamed inspection.
+        """
+        job = kernelJobs().submit(
+            self.processResponse, "moreBatch", token, request=self._request_id
+        )
+        self.addJob(job)
+
+    def rowNames(self):
+        """ rowNames()
+        Names of the records.
+        """
+        return list(self._uno_dict)
+
+    def rowData(self, name):
+        """ rowData(name)
+        Return type, kind and repr of name.
+        """
+        entry = self._uno_dict[name]
+        return str(entry["type"]), entry["kind"], str(entry["repr"])
+
+    def requestValues(self, names):
+        """ requestValues(names)
+        Fetch property values left out by the lazy inspection.
+        """
+        shell = pyzo.shells.getCurrentShell()
+        if shell and self._name and names:
+            job = kernelJobs().submitPath(
+                self.processValues, "inspectValues", self._name, names
+            )
+            self.addJob(job)
+
+    def processValues(self, future):
+        """ processValues(future)
+        We got property values, update our dict and notify the tree.
+        """
+        if future.cancelled():
+            return
+        elif future.exception():
+            print("Introspect-values-exception: ", future.exception())
+            return
+
+        response = future.result()
+        # ignore values of the previously inspected object
+        if future._pyuno_request != self._request_id or not isinstance(
+            response, dict
+        ):
+            return
+
+        for name, rep in response.items():
+            if name in self._uno_dict:
+                self._uno_dict[name]["repr"] = rep
+        self.haveNewValues.emit(response)
+
+    def requestMoreItems(self, method):
+        """ requestMoreItems(method)
+        List the next page of items for the method.
+        """
+        shell = pyzo.shells.getCurrentShell()
+        token = self._uno_dict.get(method, {}).get("more")
+        if shell and token:
+            job = kernelJobs().submit(self.processMoreItems, "moreItems", token)
+            job._pyuno_method = method
+            self.addJob(job)
+
+    def requestItems(self, method, prefix=""):
+        """ requestItems(method, prefix)
+        List the first page of items for the method, names with prefix.
+        """
+        shell = pyzo.shells.getCurrentShell()
+        if shell and self._name and method in self._uno_dict:
+            job = kernelJobs().submitPath(
+                self.processItems, "listItems", self._name, method, prefix=prefix
+            )
+            job._pyuno_method = method
+            self.addJob(job)
+
+    def processMoreItems(self, future):
+        """ processMoreItems(future)
+        We got the next page of items, update our dict and notify the tree.
+        """
+        self.processItems(future, more=True)
 
-            if pyzo.config.tools.pyzopyunoworkspace.clearScreenAfter:
-                shell.clearScreen()
+    def processItems(self, future, more=False):
+        """ processItems(future, more)
+        We got a page of items, update our dict and notify the tree.
+        """
+        if future.cancelled():
+            return
+        elif future.exception():
+            print("Introspect-items-exception: ", future.exception())
+            return
+
+        response = future.result()
+        if future._pyuno_request != self._request_id or not isinstance(
+            response, dict
+        ):
+            return
+
+        method = future._pyuno_method
+        if more:
+            self._uno_dict[method]["items"].extend(response["items"])
+        else:
+            self._uno_dict[method]["items"] = list(response["items"])
+        self._uno_dict[method]["more"] = response["more"]
+        self.haveMoreItems.emit(method, response, more)
 
     def goUp(self):
         """ goUp()
-        Cut the last part off the name.
+        Cut the last part off the name, show the cached result of it.
         """
         if self._name:
             parts = splitNameCleaner(self._name)
             if parts:
                 parts.pop()
 
-            self.setName(joinName(parts))
+            self.setName(joinName(parts), cached=True)
 
     def onCurrentShellChanged(self):
         """ onCurrentShellChanged()
@@ -236,8 +911,9 @@ class PyUNOWorkspaceProxy(QtCore.QObject):
         """
         shell = pyzo.shells.getCurrentShell()
         if not shell:
-            self._variables = []
             self._uno_dict = {}
+            self._shown_name = None
+            self.clearCached()
             self.haveNewData.emit()
 
     def onCurrentShellStateChanged(self):
@@ -247,20 +923,27 @@ class PyUNOWorkspaceProxy(QtCore.QObject):
         shell = pyzo.shells.getCurrentShell()
         if not shell:
             # Should never happen I think, but just to be sure
-            self._variables = []
             self._uno_dict = {}
 
         elif shell._state.lower() != "busy":
-            # via pyzo
-            future = shell._request.dir2(self._name)
-            future.add_done_callback(self.processResponse)
+            # The code run in the shell may change the navigated objects
+            if self._name:
+                shell._request.eval(sessionCall("clearHandles"))
+            self.clearCached(shell)
+            self.scheduleRequest()
 
     def processResponse(self, future):
         """ processResponse(response)
         We got a response, update our list and notify the tree.
+        The first response of the request replaces the shown data,
+        the next ones add rows.
         """
 
-        response = []
+        # Response of an older request
+        if future._pyuno_request != self._request_id:
+            return
+
+        response = None
 
         # Process future
         if future.cancelled():
@@ -269,35 +952,94 @@ class PyUNOWorkspaceProxy(QtCore.QObject):
             print("Introspect-queryDoc-exception: ", future.exception())
         else:
             response = future.result()
+        if response is None:
+            # an incomplete result is not cached
+            self._failed = True
+
+        if not self._shown and self._next is None:
+            self._uno_dict = {}
 
-        # Introspection via pyzo
-        self._variables = response
+        if not isinstance(response, dict):
+            response = {}
+            self._failed = True
+        elif response.get("request") != self._request_id:
+            return
+        elif response.get("lost"):
+            # the kernel dropped the rest of the inspection
+            self._failed = True
+        uno_dict = unpackResult(response)
+        if self._next is None:
+            self._uno_dict.update(uno_dict)
+        else:
+            self._next.update(uno_dict)
+        names = list(uno_dict)
+        if response.get("more"):
+            self.requestBatch(response["more"])
+        else:
+            self._waiting.discard("uno_dict")
+        if response.get("stats"):
+            self.haveStats.emit(response["stats"])
 
-        # Introspection via unoinspect - read json
-        with open(RESULT_JSON) as resultf:
-            self._uno_dict = load(resultf)
+        if self._waiting:
+            if self._next is not None:
+                return
+        elif self._next is not None:
+            if self._failed:
+                # an incomplete result removes no rows
+                rows = dict(self._uno_dict)
+                rows.update(self._next)
+                self._next = rows
+            self.takeNext()
+            names = None
+
+        if not self._waiting and not self._failed:
+            self.storeCached(self._request_shell, self._name, self._uno_dict)
+            self._prefetch_timer.start()
+
+        if names is None:
+            pass  # shown by takeNext
+        elif not self._shown:
+            self._shown = True
+            self._shown_name = self._name
+            self.haveNewData.emit()
+        else:
+            self.haveNewRows.emit(names)
+
+    def takeNext(self):
+        """ takeNext()
+        Show the complete new result of the shown name at once, so the
+        tree updates only the changed rows.
+        """
+        next = self._next
+        self._next = None
+
+        # fetched lazy values are shown until they are fetched again
+        stale = []
+        for name, entry in next.items():
+            old = self._uno_dict.get(name)
+            if entry["repr"] == LAZY_REPR and old and old["repr"] != LAZY_REPR:
+                entry["repr"] = old["repr"]
+                stale.append(name)
+
+        self._uno_dict = next
+        self._shown = True
         self.haveNewData.emit()
+        if stale:
+            self.requestValues(stale)
 
 
-class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
+class PyUNOWorkspaceTree(QtWidgets.QTreeView):
     """ WorkspaceTree
 
     The tree that displays the items in the current namespace.
-    I first thought about implementing this using the mode/view
-    framework, but it is so much work and I can't seem to fully
-    understand how it works :(
-
-    The QTreeWidget is so very simple and enables sorting very
-    easily, so I'll stick with that ...
+    The rows live in a PyUNOWorkspaceModel, the view shows them through
+    a PyUNOWorkspaceSortModel which sorts and hides rows, so updates
+    touch the row store only and the view paints the visible rows.
 
     """
 
     def __init__(self, parent):
-        QtWidgets.QTreeWidget.__init__(self, parent)
-
-        # create JSON serialization file
-        if not os.path.isfile(RESULT_JSON) or not os.path.isfile(RESULT_PICKLE):
-            createResultFile()
+        QtWidgets.QTreeView.__init__(self, parent)
 
         # create history file
         if not os.path.isfile(HISTORY):
@@ -312,10 +1054,14 @@ class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
         self._tree_type = ""
         self._tree_repr = ""
 
+        # Rows and their sorted and filtered view
+        self._model = PyUNOWorkspaceModel(self)
+        self._sort_model = PyUNOWorkspaceSortModel(self._config, self)
+        self._sort_model.setSourceModel(self._model)
+        self.setModel(self._sort_model)
+
         # Set header stuff
         self.setHeaderHidden(False)
-        self.setColumnCount(3)
-        self.setHeaderLabels(["Name", "Type", "Repr"])
         # Set first column width
         self.setColumnWidth(0, 170)
         self.setSortingEnabled(True)
@@ -323,10 +1069,26 @@ class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
         # Nice rows
         self.setAlternatingRowColors(True)
         self.setRootIsDecorated(False)
+        self.setUniformRowHeights(True)
 
         # Create proxy
         self._proxy = PyUNOWorkspaceProxy()
         self._proxy.haveNewData.connect(self.fillWorkspace)
+        self._proxy.haveNewValues.connect(self.fillValues)
+        self._proxy.haveMoreItems.connect(self.fillMoreItems)
+        self._proxy.haveNewRows.connect(self.fillRows)
+        self._proxy.haveStats.connect(self.fillStats)
+
+        # Name of the rows in the tree
+        self._filled_name = None
+
+        # Lazy property values are requested for the visible rows
+        self._requested_values = set()
+        self._values_timer = QtCore.QTimer(self)
+        self._values_timer.setSingleShot(True)
+        self._values_timer.setInterval(100)
+        self._values_timer.timeout.connect(self.loadVisibleValues)
+        self.verticalScrollBar().valueChanged.connect(self._values_timer.start)
 
         # For menu
         self.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
@@ -334,9 +1096,15 @@ class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
         self._menu.triggered.connect(self.contextMenuTriggered)
 
         # Bind to events
-        self.itemActivated.connect(self.onItemExpand)
+        self.activated.connect(self.onItemExpand)
         self.clicked.connect(self.onItemClicked)
 
+    def rowAt(self, index):
+        """ rowAt(index)
+        Return name, type, repr and kind of the row of the view index.
+        """
+        return self._model.row(self._sort_model.mapToSource(index).row())
+
     def contextMenuEvent(self, event):
         """ contextMenuEvent(event)
         Show the context menu.
@@ -345,9 +1113,10 @@ class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
         QtWidgets.QTreeView.contextMenuEvent(self, event)
 
         # Get if an item is selected
-        item = self.currentItem()
-        if not item:
+        index = self.currentIndex()
+        if not index.isValid():
             return
+        name, typ, rep, kind = self.rowAt(index)
 
         # Create menu
         self._menu.clear()
@@ -362,15 +1131,22 @@ class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
             "Open Office Snippets Search",
         ]
 
+        # sequence value, eg. DataArray
+        if typ.startswith("[]") or kind in ("list", "tuple"):
+            workspace_menu.extend(["sep", "Summarize"])
+
+        # cell range with XCellRangeData
+        if "getDataArray" in self._proxy._uno_dict:
+            workspace_menu.extend(["sep", "View DataArray", "View FormulaArray"])
+
         for a in workspace_menu:
             if a == "sep":
                 self._menu.addSeparator()
             else:
                 action = self._menu.addAction(a)
                 parts = splitName(self._proxy._name)
-                parts.append(item.text(0))
+                parts.append(name)
                 action._objectName = joinName(parts)
-                action._item = item
 
         # Show
         self._menu.popup(QtGui.QCursor.pos() + QtCore.QPoint(3, 3))
@@ -405,6 +1181,15 @@ class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
             url = SNIPPET_PATH + search + SNIPPET_SUFIX
             webbrowser.open(url)
 
+        elif "View DataArray" in req or "View FormulaArray" in req:
+            # Show cells of the inspected range
+            view = RangeView(self._proxy._name, "Formula" in req, self)
+            view.show()
+
+        elif "Summarize" in req:
+            # Statistics, head and tail of the sequence
+            kernelJobs().submitPath(self.fillSummary, "summarize", action._objectName)
+
         # ------- End PyUNO ----------------
 
         elif "Delete" in req:
@@ -412,20 +1197,16 @@ class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
             if shell:
                 shell.processLine("del " + action._objectName)
 
-    def onItemExpand(self, item):
-        """ onItemExpand(item)
+    def onItemExpand(self, index):
+        """ onItemExpand(index)
         Inspect the attributes of that item
         Add arguments to item if needed and then inspect the attributes of that item.
         """
-        inspect_item = item.text(0)
+        name, typ, rep, kind = self.rowAt(index)
+        inspect_item = name
 
         # if item is UNO method
-        if item.text(0)[0].islower():
-            # get item name and arguments
-            name = item.text(0)
-            typ = item.text(1)
-            rep = item.text(2)
-
+        if name[0].islower():
             if name == "value" and (typ == "pyuno.struct" or typ == "struct"):
                 pass
             elif rep == "( )":
@@ -458,10 +1239,16 @@ class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
         """ resetWidget
         Reset widgets to default.
         """
+        self.clearWidget()
+        self.parent()._description.setText(self.parent().initText)
+
+    def clearWidget(self):
+        """ clearWidget
+        Clear and deactivate widgets.
+        """
         self.parent()._element_names.clear()
         self.parent()._element_index.clear()
         self.parent()._enumerate_index.clear()
-        self.parent()._description.setText(self.parent().initText)
 
         self.parent()._selection.setEnabled(False)
         self.parent()._element_names.setEnabled(False)
@@ -476,9 +1263,12 @@ class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
         if "getByName" in self._proxy._uno_dict.keys():
             if self._proxy._uno_dict["getByName"]["items"]:
                 self.parent()._element_names.addItem("--Name--")
+                self.parent()._element_names.addItem(FILTER_ITEMS)
                 self.parent()._element_names.addItems(
                     self._proxy._uno_dict["getByName"]["items"]
                 )
+                if self._proxy._uno_dict["getByName"].get("more"):
+                    self.parent()._element_names.addItem(MORE_ITEMS)
                 self.parent()._element_names.setEnabled(True)
 
         if "getByIndex" in self._proxy._uno_dict.keys():
@@ -487,6 +1277,8 @@ class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
                 self.parent()._element_index.addItems(
                     self._proxy._uno_dict["getByIndex"]["items"]
                 )
+                if self._proxy._uno_dict["getByIndex"].get("more"):
+                    self.parent()._element_index.addItem(MORE_ITEMS)
                 self.parent()._element_index.setEnabled(True)
 
         if "createEnumeration" in self._proxy._uno_dict.keys():
@@ -496,85 +1288,215 @@ class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
                 self.parent()._enumerate_index.addItems(
                     self._proxy._uno_dict["createEnumeration"]["items"]
                 )
+                if self._proxy._uno_dict["createEnumeration"].get("more"):
+                    self.parent()._enumerate_index.addItem(MORE_ITEMS)
                 self.parent()._enumerate_index.setEnabled(True)
 
         if "getCurrentSelection" in self._proxy._uno_dict.keys():
             if self._proxy._uno_dict["getCurrentSelection"]:
                 self.parent()._selection.setEnabled(True)
 
+    def fillMoreItems(self, method, page, append):
+        """ fillMoreItems(method, page, append)
+        Replace the --More-- entry of the method combo box with the page,
+        or the listed names with the filtered page.
+        """
+        combo = {
+            "getByName": self.parent()._element_names,
+            "getByIndex": self.parent()._element_index,
+            "createEnumeration": self.parent()._enumerate_index,
+        }[method]
+
+        if append:
+            more = combo.findText(MORE_ITEMS)
+            if more >= 0:
+                combo.removeItem(more)
+        else:
+            combo.clear()
+            combo.addItem("--Name--")
+            combo.addItem(FILTER_ITEMS)
+        combo.addItems(page["items"])
+        if page["more"]:
+            combo.addItem(MORE_ITEMS)
+
     def fillWorkspace(self):
         """ fillWorkspace()
-        Update the workspace tree.
+        Update the workspace tree. The rows of another name replace all
+        rows, new data of the shown name updates only the changed rows.
         """
+        rows = self.rows(self._proxy.rowNames())
 
-        # Clear tree and widget first
-        self.clear()
-        self.resetWidget()
+        # the value jobs of the previous request are cancelled
+        self._requested_values = set()
 
-        # Set name
-        line = self.parent()._line
-        line.setText(self._proxy._name)
+        if self._proxy._name == self._filled_name:
+            # Keep scroll position, selection and help
+            self.clearWidget()
+            self.fillWidget()
+            self._model.mergeRows(rows)
 
-        # Fill history and widgets
-        if line.text():
-            self.parent().onAddToHistory(line.text().strip())
-        self.fillWidget()
+        else:
+            self._filled_name = self._proxy._name
 
-        # Add elements
-        for des in self._proxy._variables:
+            # Clear widget first
+            self.resetWidget()
 
-            # Get parts
-            try:
-                parts = des.split(",", 4)
-            except:
-                parts = list(des)
+            # Set name
+            line = self.parent()._line
+            line.setText(self._proxy._name)
 
-            if len(parts) < 4:
-                continue
-            # -- Name --
-            name = parts[0]
-            # -- Type, Repr --
-            if name in self._proxy._uno_dict.keys():
-                typ = str(self._proxy._uno_dict[name]["type"])
-                rep = str(self._proxy._uno_dict[name]["repr"])
-            else:
-                typ = parts[1]
-                rep = parts[-1]
+            # Fill history and widgets
+            if line.text():
+                self.parent().onAddToHistory(line.text().strip())
+            self.fillWidget()
 
-            # Pop the 'kind' element
-            kind = parts.pop(2)
+            # Add elements
+            self._model.setRows(rows)
+
+            # scroll on the start
+            self.scrollToTop()
+
+        self.parent().displayEmptyWorkspace(
+            self._sort_model.rowCount() == 0 and self._proxy._name == ""
+        )
+
+        # load lazy values of the visible rows
+        self._values_timer.start()
+
+    def updateFilter(self):
+        """ updateFilter()
+        Show or hide rows after config.hideTypes changed.
+        """
+        self._sort_model.invalidateFilter()
+        self.parent().displayEmptyWorkspace(
+            self._sort_model.rowCount() == 0 and self._proxy._name == ""
+        )
+        self._values_timer.start()
+
+    def fillRows(self, names):
+        """ fillRows(names)
+        Add or update the rows of the names which arrived later.
+        """
+        self._model.updateRows(self.rows(names))
+
+        # items of getByName, getByIndex... arrived
+        if set(names) & {
+            "getByName",
+            "getByIndex",
+            "createEnumeration",
+            "getCurrentSelection",
+        }:
+            self.clearWidget()
+            self.fillWidget()
+
+        self.parent().displayEmptyWorkspace(
+            self._sort_model.rowCount() == 0 and self._proxy._name == ""
+        )
+        self._values_timer.start()
+
+    def rows(self, names):
+        """ rows(names)
+        Return the rows of the names for the model.
+        """
+        rows = []
+        for name in names:
+            # -- Type, Kind, Repr --
+            typ, kind, rep = self._proxy.rowData(name)
 
-            if kind in self._config.hideTypes:
-                continue
-            if name.startswith("_") and "private" in self._config.hideTypes:
-                continue
             if name == "ImplementationName":
                 pyzo.main.statusBar().showMessage(rep, 5000)
             if rep.startswith("pyuno object ("):
                 rep = "pyuno object"
 
-            # Create item
-            item = PyUNOWorkspaceItem([name, typ, rep], 0)
-            # item = PyUNOWorkspaceItem(parts, 0)
-            self.addTopLevelItem(item)
-
-            # Set background color
-            # item.setBackground(0, QtGui.QColor(255, 255, 255))
-            # item.setBackground(1, QtGui.QColor(255, 255, 255))
-            # item.setBackground(2, QtGui.QColor(255, 255, 255))
+            rows.append((name, typ, rep, kind))
+        return rows
 
-            # Set tooltip
-            # tt = "%s: %s" % (parts[0], parts[-1])
-            # item.setToolTip(0, tt)
-            # item.setToolTip(1, tt)
-            # item.setToolTip(2, tt)
+    def fillStats(self, stats):
+        """ fillStats(stats)
+        Show the inspection phases and the slowest members in the help.
+        """
+        txt = "<p style = 'background-color: palegreen'>Timing of {}</p>".format(
+            self._proxy._name
+        )
+        txt += "<p><strong>Phases</strong></p>"
+        for phase, t in sorted(stats["phases"].items(), key=lambda p: -p[1]):
+            txt += "<p>{:<20} {:.1f} ms</p>".format(phase, t * 1000)
+        txt += "<p><strong>Slowest members</strong></p>"
+        for name, t, calls in stats["slowest"]:
+            txt += "<p>{} {:.1f} ms, {} calls</p>".format(name, t * 1000, calls)
+
+        self.parent()._description.setText(txt)
+
+    def fillSummary(self, future):
+        """ fillSummary(future)
+        Show the summary of a sequence in the help, see
+        unoinspect.Inspector.summarize.
+        """
+        if future.cancelled():
+            return
+        elif future.exception():
+            print("Summary-exception: ", future.exception())
+            return
 
-        # scroll on the start
-        self.scrollToItem(self.topLevelItem(0))
+        summary = future.result()
+        if not isinstance(summary, dict):
+            print("Summary-exception: ", summary)
+            return
 
-        self.parent().displayEmptyWorkspace(
-            self.topLevelItemCount() == 0 and self._proxy._name == ""
+        txt = "<p style = 'background-color: palegreen'>Summary</p>"
+        txt += "<p>shape {}, {}</p>".format(
+            " x ".join(str(d) for d in summary["shape"]), summary["dtype"]
         )
+        if summary["mean"] is not None:
+            txt += "<p>min {:g}, max {:g}, mean {:g}</p>".format(
+                summary["min"], summary["max"], summary["mean"]
+            )
+        if summary["numbers"] is not None:
+            txt += "<p>{} numbers, {} empty, {} null</p>".format(
+                summary["numbers"], summary["empty"], summary["nulls"]
+            )
+        txt += "<p><strong>Head</strong></p>"
+        for item in summary["head"]:
+            txt += "<p>{}</p>".format(html.escape(item))
+        if summary["tail"]:
+            txt += "<p><strong>Tail</strong></p>"
+            for item in summary["tail"]:
+                txt += "<p>{}</p>".format(html.escape(item))
+
+        self.parent()._description.setText(txt)
+
+    def resizeEvent(self, event):
+        QtWidgets.QTreeView.resizeEvent(self, event)
+        self._values_timer.start()
+
+    def loadVisibleValues(self):
+        """ loadVisibleValues()
+        Request lazy property values for the rows in the viewport.
+        """
+        names = []
+        first = self.indexAt(QtCore.QPoint(0, 0))
+        if first.isValid():
+            last = self.indexAt(QtCore.QPoint(0, self.viewport().height() - 1))
+            if last.isValid():
+                end = last.row()
+            else:
+                end = self._sort_model.rowCount() - 1
+            for row in range(first.row(), end + 1):
+                name, typ, rep, kind = self.rowAt(self._sort_model.index(row, 0))
+                if rep == LAZY_REPR and name not in self._requested_values:
+                    names.append(name)
+
+        if names:
+            self._requested_values.update(names)
+            self._proxy.requestValues(names)
+
+    def fillValues(self, values):
+        """ fillValues(values)
+        Show the fetched property values.
+        """
+        self._model.setReprs(values)
+        if self._tree_name in values:
+            self._tree_repr = values[self._tree_name]
 
     def onItemClicked(self):
         """ onItemClicked()
@@ -586,21 +1508,26 @@ class PyUNOWorkspaceTree(QtWidgets.QTreeWidget):
         self._tree_type = ""
         self._tree_repr = ""
 
-        # Get tree items
-        items = self.currentItem()
+        # Get tree row
+        index = self.currentIndex()
+        if not index.isValid():
+            return
+
+        # store tree row in vars
+        self._tree_name, self._tree_type, self._tree_repr, kind = self.rowAt(index)
 
-        # store tree items in vars
-        self._tree_name = str(items.data(0, 0))
-        self._tree_type = str(items.data(1, 0))
-        self._tree_repr = str(items.data(2, 0))
+        # load lazy value
+        if self._tree_repr == LAZY_REPR:
+            self._requested_values.add(self._tree_name)
+            self._proxy.requestValues([self._tree_name])
 
         # Find documentation for this item
-        find = str(items.data(0, 0))
+        find = self._tree_name
 
         try:
-            kind = str(self._proxy._uno_dict[find]["desc"])
+            source = self._proxy._uno_dict[find]["source"]
             # find in UNO or Python documentation
-            if kind.startswith("uno"):
+            if source == "uno":
                 # UNO
                 self.unoDescriptions(find)
             else:
@@ -19,20 +19,47 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 
 import argparse
-from json import dump
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from json import dump, dumps
 import pickle
+import queue
+import reprlib
 from inspect import getsourcefile, signature
+from itertools import chain
 import os
+import sys
 from os.path import abspath, dirname, join, realpath, exists
+import threading
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import uno
+    from com.sun.star.beans.MethodConcept import ALL as _METHOD_CONCEPT_ALL
+    from com.sun.star.beans.PropertyConcept import ALL as _PROPERTY_CONCEPT_ALL
+    from com.sun.star.lang import DisposedException as _DisposedException
+    from com.sun.star.reflection.ParamMode import (
+        IN as _PARAM_MODE_IN,
+        OUT as _PARAM_MODE_OUT,
+        INOUT as _PARAM_MODE_INOUT,
+    )
+except ImportError:
+    # without pyuno the namespace and Python objects are inspected only
+    uno = None
+    _METHOD_CONCEPT_ALL = _PROPERTY_CONCEPT_ALL = None
+    _PARAM_MODE_IN = _PARAM_MODE_OUT = _PARAM_MODE_INOUT = None
+
+    class _DisposedException(Exception):
+        pass
 
-import uno
-from com.sun.star.beans.MethodConcept import ALL as _METHOD_CONCEPT_ALL
-from com.sun.star.beans.PropertyConcept import ALL as _PROPERTY_CONCEPT_ALL
-from com.sun.star.reflection.ParamMode import (
-    IN as _PARAM_MODE_IN,
-    OUT as _PARAM_MODE_OUT,
-    INOUT as _PARAM_MODE_INOUT,
-)
 
 _PATH = abspath(getsourcefile(lambda: 0))
 # output file path
@@ -42,6 +69,54 @@ _PICKLE_FILE = "result.pkl"
 
 _DEBUG = False
 
+# number of object types whose schema is kept in the cache
+_SCHEMA_CACHE_SIZE = 128
+# bridge calls charged for introspecting the schema of a new type
+_SCHEMA_CALLS = 3
+
+# repr of the property values which are not fetched yet
+LAZY_REPR = "< ... >"
+# properties always fetched, also in lazy mode
+_EAGER_PROPERTIES = ("ImplementationName",)
+# property not available on the object
+_MISSING = object()
+# maximum length of the shown value representation
+_REPR_LIMIT = 120
+# sequence elements summarized with numpy, head and tail length
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+_SUMMARY_MAX_CELLS = 10000000
+_SUMMARY_HEAD = 5
+# rows of cell range read per block
+_RANGE_BLOCK = 200
+# office connection and number of inspected expressions at once of main
+_URL = "uno:socket,host=localhost,port=2002,tcpNoDelay=1;urp;StarOffice.ComponentContext"
+_CLI_WORKERS = 4
+# number of jobs of the session worker kept until they are polled
+_JOB_CACHE_SIZE = 64
+
+# items listed per page and time limit for one page in seconds
+_PAGE_SIZE = 200
+_TIME_BUDGET = 0.5
+# number of open item listings which can be continued
+_CONTINUATION_CACHE_SIZE = 32
+# number of entries per batch of the streamed inspection
+_BATCH_SIZE = 50
+# number of open streamed inspections which can be continued
+_STREAM_CACHE_SIZE = 4
+# number of object handles kept for navigation
+_HANDLE_CACHE_SIZE = 64
+# methods whose items are listed
+_ITEM_METHODS = (
+    "getByName",
+    "getByIndex",
+    "createEnumeration",
+    "getSupportedServiceNames",
+)
+# number of slowest members reported in the stats
+_STATS_SLOWEST = 10
+# bridge calls of one prefetched inspection, see InspectionSession.prefetch
+_PREFETCH_CALLS = 300
+
 # print('**********************')
 # print('_PATH = ' + _PATH)
 # print('_DIR = ' + _DIR)
@@ -49,6 +124,112 @@ _DEBUG = False
 # print('_PICKLE_FILE = ' + _PICKLE_FILE)
 
 
+def _cut(text, limit=_REPR_LIMIT):
+    """Return text cut to limit characters, marked with '..'
+    """
+    return (text[:limit] + "..") if len(text) > limit else text
+
+
+def _scalar(value):
+    """Return numpy scalar as Python value, other values as they are
+    """
+    return value.item() if hasattr(value, "item") else value
+
+
+class _BoundedRepr(reprlib.Repr):
+    """Representation of values with bounded size
+
+    Like reprlib.Repr, containers and strings are cut before their text
+    is built, so a large value costs no more than its shown part.
+    UNO interfaces are shown as 'pyuno object' without asking the
+    bridge for their repr, UNO structs member by member.
+
+    """
+
+    def __init__(self, limit=_REPR_LIMIT):
+        reprlib.Repr.__init__(self)
+        self.limit = limit
+        self.maxlevel = 3
+        self.maxtuple = self.maxlist = self.maxarray = 12
+        self.maxdict = self.maxset = self.maxfrozenset = self.maxdeque = 8
+        self.maxstring = self.maxlong = self.maxother = limit
+
+    def str(self, x):
+        """Like str(x), strings are cut to the limit
+        """
+        if isinstance(x, str):
+            return x[: self.limit + 1]
+        # numbers and None, most of the values
+        if x is None or type(x) in (int, float, bool):
+            return repr(x)
+        return self.repr(x)
+
+    def repr_bytes(self, x, level):
+        text = repr(x[: self.maxstring])
+        return text + ".." if len(x) > self.maxstring else text
+
+    # UNO interface
+    def repr_pyuno(self, x, level):
+        return "pyuno object"
+
+    # UNO struct
+    def repr_pyuno_struct(self, x, level):
+        if level <= 0:
+            return "{ ... }"
+        parts = []
+        size = 0
+        for name in dir(x):
+            if name.startswith("_"):
+                continue
+            if size > self.limit:
+                parts.append("...")
+                break
+            part = "{} = {}".format(name, self.repr1(getattr(x, name), level - 1))
+            parts.append(part)
+            size += len(part) + 2
+        return "{ " + ", ".join(parts) + " }"
+
+    # uno.ByteSequence
+    def repr_ByteSequence(self, x, level):
+        return "<ByteSequence {}>".format(self.repr1(x.value, level))
+
+
+_REPR = _BoundedRepr()
+
+
+def _namespace():
+    """Return namespace of the shell as pyzo's introspection: the locals
+    and globals of pyzo's interpreter, the frame while debugging, or
+    the variables of __main__ outside pyzo
+    """
+    interpreter = getattr(sys, "_pyzoInterpreter", None)
+    if interpreter is None:
+        import __main__
+
+        return vars(__main__)
+
+    namespace = dict(interpreter.globals or {})
+    namespace.update(interpreter.locals)
+    return namespace
+
+
+def _kind(value):
+    """Return kind of value as pyzo's workspace: type name, or 'array',
+    'list' and 'tuple'
+    """
+    typ = type(value).__name__
+    # attribute lookups of UNO objects are bridge calls
+    if typ == "type" or typ.startswith("pyuno"):
+        return typ
+    if hasattr(value, "__array__") and hasattr(value, "dtype") and hasattr(value, "shape"):
+        return "array"
+    if isinstance(value, list):
+        return "list"
+    if isinstance(value, tuple):
+        return "tuple"
+    return typ
+
+
 def _mode_to_str(mode):
     ret = "[]"
     if mode == _PARAM_MODE_INOUT:
@@ -60,6 +241,215 @@ def _mode_to_str(mode):
     return ret
 
 
+class _LRUCache:
+    """Bounded mapping which evicts the least recently used entry
+
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Return value for key and mark it as recently used
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Store value, evict the oldest entries above maxsize
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class _Stats:
+    """Per-phase durations and per-member call counts and durations
+
+    Members are properties and methods, durations are in seconds and
+    accumulate over the calls, also from worker threads.
+
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.members = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        """Add duration of the with block to phase name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.addPhase(name, time.perf_counter() - start)
+
+    def addPhase(self, name, seconds):
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def addMember(self, name, seconds, calls=1):
+        with self._lock:
+            entry = self.members.setdefault(name, [0, 0.0])
+            entry[0] += calls
+            entry[1] += seconds
+
+    def result(self, members=True):
+        """Return dict with
+            'phases': dict phase: seconds
+            'slowest': list of [member, seconds, calls], slowest first
+            'members': dict member: {'calls', 'time'}, if members
+        """
+        with self._lock:
+            phases = dict(self.phases)
+            entries = sorted(self.members.items(), key=lambda m: m[1][1], reverse=True)
+
+        result = {
+            "phases": phases,
+            "slowest": [[name, t, c] for name, (c, t) in entries[:_STATS_SLOWEST]],
+        }
+        if members:
+            result["members"] = {name: {"calls": c, "time": t} for name, (c, t) in entries}
+        return result
+
+
+class _Cancelled(BaseException):
+    """Job of the session worker is cancelled
+
+    Not an Exception, so the error handling of the inspection does not
+    take it for an error of the inspected object.
+
+    """
+
+
+# job run by the current thread, with its cancel event and bridge call
+# budget, see InspectionSession and Inspector._map
+_JOB = threading.local()
+
+
+def _checkCancelled(calls=0):
+    """Raise _Cancelled if the job of the current thread is cancelled
+    or has spent its bridge call budget
+
+    :param calls: number of bridge calls the caller is about to make
+    """
+    job = getattr(_JOB, "job", None)
+    if job is None:
+        return
+    if job.cancel.is_set():
+        raise _Cancelled("cancelled")
+
+    if job.calls is not None and calls:
+        # shared by the threads of Inspector._map
+        with job.lock:
+            if job.calls < calls:
+                raise _Cancelled("budget")
+            job.calls -= calls
+
+
+# property and method schema shared by all Inspector instances,
+# keyed by implementation name and supported interfaces
+_SCHEMA_CACHE = _LRUCache(_SCHEMA_CACHE_SIZE)
+
+# state of the item listings which have more pages, keyed by token
+_CONTINUATIONS = _LRUCache(_CONTINUATION_CACHE_SIZE)
+_TOKENS = count(1)
+
+# streamed inspections which have more batches, keyed by token
+_STREAMS = _LRUCache(_STREAM_CACHE_SIZE)
+
+# objects of the navigated paths, keyed by path,
+# value is (root object, object)
+_HANDLES = _LRUCache(_HANDLE_CACHE_SIZE)
+
+
+def _splitPath(path):
+    """Split path in root and steps
+
+    Path is split at top level dots and brackets, joined root
+    and steps give the path, eg.
+    'doc.Sheets.getByName("a.b")[0]' -> 'doc', ['.Sheets', '.getByName("a.b")', '[0]']
+
+    :param path: object expression
+    Return root, list of steps
+
+    """
+    parts = []
+    depth = 0
+    quote = None
+    start = 0
+    for i, char in enumerate(path):
+        if quote:
+            if char == quote and path[i - 1] != "\\":
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "([{":
+            if char == "[" and depth == 0 and i > start:
+                parts.append(path[start:i])
+                start = i
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char == "." and depth == 0 and i > start:
+            parts.append(path[start:i])
+            start = i
+
+    parts.append(path[start:])
+    return parts[0].strip(), parts[1:]
+
+
+def compact(context, request=None):
+    """Pack inspection result for the transfer to the workspace
+
+    :param context: result of Inspector.inspect(object, output='dict')
+    :param request: request id of the workspace
+    Return dict with
+        'request': request id
+        'rows': list of records [name, type, kind, repr, source], kind
+                is the Python kind or the UNO member description,
+                source is 'uno' or 'python'
+        'items': dict name: {'items': list, 'more': token} for the
+                 entries with items
+    """
+    rows = []
+    items = {}
+    for name, value in context.items():
+        desc = value["desc"]
+        source = "uno" if desc.startswith("uno") else "python"
+        kind = value.get("kind", desc)
+        rows.append([name, value["type"], kind, value["repr"], source])
+        if value["items"] or value.get("more"):
+            items[name] = {"items": value["items"], "more": value.get("more")}
+
+    return {"request": request, "rows": rows, "items": items}
+
+
 # -----------------------------------------------------------
 #               INSPECTION
 # -----------------------------------------------------------
@@ -70,13 +460,48 @@ class Inspector:
 
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        page_size=_PAGE_SIZE,
+        time_budget=_TIME_BUDGET,
+        workers=0,
+        stats=False,
+        ctx=None,
+    ):
+        """
+        :param page_size: maximum number of items listed per page
+        :param time_budget: time limit in seconds for listing one page
+        :param workers: number of threads fetching property values and
+                        item lists concurrently, 0 or 1 fetch in turn
+        :param stats: record per-phase durations and per-member calls,
+                      returned as '_stats' of the result, see inspect
+        :param ctx: component context, default local context
 
-        try:
-            self.ctx = uno.getComponentContext()
-        except Exception as err:
-            if _DEBUG:
-                print(err)
+        """
+
+        self.page_size = page_size
+        self.time_budget = time_budget
+        self.workers = workers
+        # threads of _map, created on first use
+        self._executor = None
+        self.stats = stats
+        self._stats = None
+
+        self.ctx = ctx
+        if ctx is None and uno is not None:
+            try:
+                self.ctx = uno.getComponentContext()
+            except Exception as err:
+                if _DEBUG:
+                    print(err)
+
+        # without component context Python objects are inspected only
+        self.smgr = None
+        self.introspection = None
+        self.reflection = None
+        self.documenter = None
+        if self.ctx is None:
+            return
 
         self.smgr = self.ctx.ServiceManager
         self.introspection = self.ctx.getValueByName(
@@ -90,137 +515,68 @@ class Inspector:
             "/singletons/com.sun.star.util.theServiceDocumenter"
         )
 
-    def _inspectProperties(self, object):
-        """Inspect properties
+    def _schemaKey(self, object):
+        """Return cache key for object type or None
 
-        :param object: Inspect properties for object
+        :param object: UNO object
 
         """
-
-        P = {}
         try:
-            inspector = self.introspection.inspect(object)
-            properties = inspector.getProperties(_PROPERTY_CONCEPT_ALL)
+            impl = str(object.getImplementationName())
+            types = frozenset(str(t.typeName) for t in object.getTypes())
+        except _DisposedException:
+            # the session starts again, see InspectionSession.run
+            raise
         except Exception as err:
             if _DEBUG:
                 print(err)
-            return P
+            return None
 
-        for property in properties:
+        return impl, types
 
-            # name
-            p_name = str(property.Name)
-            try:
-                P[p_name] = {}
-                # description
-                P[p_name]["desc"] = "uno_property"
+    def _buildSchema(self, object):
+        """Introspect object type and pre-render properties and methods
 
-                # type
-                p_typ = str(property.Type.typeName)
-
-                # repr
-                if hasattr(object, p_name):
-                    prop_value = getattr(object, p_name, None)
-
-                    # tuple
-                    if p_typ.startswith(
-                        ("[]string", "[]type", "[]com", "[][]double")
-                    ):
-                        p_rep = "< tuple with {} elements >".format(
-                            str(len(prop_value))
-                        )
-                    # pyuno object
-                    elif str(prop_value).startswith("pyuno object"):
-                        p_rep = "pyuno object"
-                    # string
-                    elif p_typ == "string":
-                        p_rep = "'{}'".format(prop_value)
-                    # bool
-                    elif p_typ == "boolean" and prop_value == 0:
-                        p_rep = "False"
-                    else:
-                        p_rep = str(prop_value)
-                        p_rep = p_rep.replace("\n", "'\n'")
-                else:
-                    p_rep = "< unknown >"
-
-                p_typ = p_typ.replace("com.sun.star.", "~ ")
-
-                P[p_name]["type"] = p_typ
-                P[p_name]["repr"] = (p_rep[:120] + "..") if len(p_rep) > 120 else p_rep
-                P[p_name]["items"] = []
-
-            except Exception as err:
-                P[p_name]["type"] = p_typ
-                P[p_name]["repr"] = "< Error property: " + str(err) + " >"
-                P[p_name]["items"] = []
-
-        return P
-
-    def _inspectMethods(self, object):
-        """Inspect methods
-
-        :param object: Inspect methods for object
+        :param object: UNO object
 
         """
-
-        M = {}
-        m_name = "ERROR"
         try:
             inspector = self.introspection.inspect(object)
-            methods = inspector.getMethods(_METHOD_CONCEPT_ALL)
+        except _DisposedException:
+            raise
+        except Exception as err:
+            if _DEBUG:
+                print(err)
+            return None
+
+        # properties: (name, type name, displayed type)
+        properties = []
+        try:
+            for property in inspector.getProperties(_PROPERTY_CONCEPT_ALL):
+                p_name = str(property.Name)
+                p_typ = str(property.Type.typeName)
+                properties.append(
+                    (p_name, p_typ, p_typ.replace("com.sun.star.", "~ "))
+                )
         except Exception as err:
             if _DEBUG:
                 print(err)
-            return M
 
-        for method in methods:
-            # name
+        # methods: (name, displayed return type, parameters)
+        methods = []
+        try:
+            uno_methods = inspector.getMethods(_METHOD_CONCEPT_ALL)
+        except Exception as err:
+            if _DEBUG:
+                print(err)
+            uno_methods = []
+
+        for method in uno_methods:
             m_name = str(method.Name)
             try:
-                M[m_name] = {}
-                # description
-                M[m_name]["desc"] = "uno_method"
-                # type
                 m_typ = str(method.getReturnType().getName())
                 m_typ = m_typ.replace("com.sun.star.", "~ ")
-                M[m_name]["type"] = m_typ
 
-                all_items = []
-                # name access
-                if m_name == "getByName":
-                    # if hasattr(object, 'getElementNames'):
-                    items = object.getElementNames()
-                    # escape bytes
-                    for item in items:
-                        all_items.append(str(item))
-                    M[m_name]["items"] = sorted(all_items)
-
-                # index access
-                elif m_name == "getByIndex":
-                    # if hasattr(object, 'getCount'):
-                    items = object.getCount()
-                    M[m_name]["items"] = [str(item) for item in range(0, items)]
-
-                # supported services
-                elif m_name == "getSupportedServiceNames":
-                    items = object.getSupportedServiceNames()
-                    M[m_name]["items"] = sorted(items)
-
-                # enumerate
-                elif m_name == "createEnumeration":
-                    enm = object.createEnumeration()
-                    e = 0
-                    while enm.hasMoreElements():
-                        value = enm.nextElement()
-                        all_items.append(str(e))
-                        e = e + 1
-                    M[m_name]["items"] = sorted(all_items)
-                else:
-                    # pass
-                    M[m_name]["items"] = all_items
-
-                # repr
                 args = method.ParameterTypes
                 infos = method.ParameterInfos
 
@@ -240,10 +596,504 @@ class Inspector:
                 params = params + ")"
                 params = params.replace(", )", " )")
 
-                # if params == "()":
-                #     params = "()"
+                methods.append((m_name, m_typ, str(params)))
+            except Exception as err:
+                methods.append(
+                    (m_name, "ERROR", "< Error method: " + str(err) + " >")
+                )
 
-                M[m_name]["repr"] = str(params)
+        # properties which XMultiPropertySet returns in one call
+        bulk = frozenset()
+        if any(m_name == "getPropertyValues" for m_name, m_typ, params in methods):
+            try:
+                info = object.getPropertySetInfo()
+                bulk = frozenset(str(p.Name) for p in info.getProperties())
+            except Exception as err:
+                if _DEBUG:
+                    print(err)
+
+        return {"properties": properties, "methods": methods, "bulk": bulk}
+
+    def _inspectSchema(self, object):
+        """Return property and method schema for object
+
+        Schema is cached per implementation name and supported
+        interfaces, so objects of the same type are introspected once.
+
+        :param object: UNO object
+
+        """
+        _checkCancelled(2)
+        with self._phase("type_key"):
+            key = self._schemaKey(object)
+        if key is not None:
+            schema = _SCHEMA_CACHE.get(key)
+            if schema is not None:
+                return schema
+
+        # fixed cost, the member calls of a rich type would spend
+        # any budget
+        _checkCancelled(_SCHEMA_CALLS)
+        with self._phase("introspection"):
+            schema = self._buildSchema(object)
+        if key is not None and schema is not None:
+            _SCHEMA_CACHE.put(key, schema)
+        return schema
+
+    def clearCache(self):
+        """Remove all cached object schemas
+        """
+        _SCHEMA_CACHE.clear()
+
+    def _phase(self, name):
+        """Return context manager timing phase name, if stats are recorded
+        """
+        if self._stats is None:
+            return nullcontext()
+        return self._stats.phase(name)
+
+    def _member(self, name, start, calls=1):
+        """Record call of member name started at start, if stats are recorded
+        """
+        if self._stats is not None:
+            self._stats.addMember(name, time.perf_counter() - start, calls)
+
+    def _startStats(self):
+        """Start new stats record if stats are enabled
+        """
+        self._stats = _Stats() if self.stats else None
+
+    def _map(self, func, items):
+        """Apply func to items, in worker threads if workers > 1
+
+        Return results in order of items
+
+        """
+        items = list(items)
+        if self.workers > 1 and len(items) > 1:
+            # the worker threads check the job of the caller
+            job = getattr(_JOB, "job", None)
+
+            def task(item):
+                _JOB.job = job
+                try:
+                    return func(item)
+                finally:
+                    _JOB.job = None
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix="unoinspect"
+                )
+            return list(self._executor.map(task, items))
+
+        return [func(item) for item in items]
+
+    def close(self):
+        """Stop the threads of the inspector, see workers
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _fetchBulk(self, object, names, values):
+        """Fetch property values with XMultiPropertySet.getPropertyValues
+
+        On error split names in halves, so only the failing properties
+        are left out of values.
+
+        :param object: UNO object
+        :param names: property names known by XPropertySetInfo
+        :param values: dict property name: value, updated
+
+        """
+        # XMultiPropertySet requires sorted names, unsorted ones return
+        # void or wrong values without error
+        names = sorted(names)
+        _checkCancelled(1)
+        start = time.perf_counter()
+        try:
+            result = object.getPropertyValues(tuple(names))
+        except _DisposedException:
+            raise
+        except Exception as err:
+            if _DEBUG:
+                print(err)
+            self._member("getPropertyValues", start)
+            if len(names) > 1:
+                half = len(names) // 2
+                self._fetchBulk(object, names[:half], values)
+                self._fetchBulk(object, names[half:], values)
+            return
+
+        self._member("getPropertyValues", start)
+        values.update(zip(names, result))
+
+    def _fetchValues(self, object, schema, names):
+        """Fetch property values
+
+        Values of the properties known by XPropertySetInfo are fetched
+        in one call, the rest one by one.
+
+        :param object: UNO object
+        :param schema: object schema
+        :param names: property names
+        Return dict property name: value, dict property name: error
+
+        """
+        values = {}
+        errors = {}
+
+        with self._phase("values"):
+            bulk = [p_name for p_name in names if p_name in schema["bulk"]]
+            if bulk:
+                self._fetchBulk(object, bulk, values)
+
+            def fetch(p_name):
+                _checkCancelled(1)
+                start = time.perf_counter()
+                try:
+                    return getattr(object, p_name, _MISSING), None
+                except _DisposedException:
+                    raise
+                except Exception as err:
+                    return None, err
+                finally:
+                    self._member(p_name, start)
+
+            single = [p_name for p_name in names if p_name not in values]
+            for p_name, (value, err) in zip(single, self._map(fetch, single)):
+                if err is None:
+                    values[p_name] = value
+                else:
+                    errors[p_name] = err
+
+        return values, errors
+
+    def _propertyRepr(self, prop_value, p_typ):
+        """Return representation of property value
+
+        :param prop_value: property value
+        :param p_typ: property type name
+
+        """
+        if prop_value is _MISSING:
+            p_rep = "< unknown >"
+        # tuple, see summarize
+        elif p_typ.startswith(("[]string", "[]type", "[]com", "[][]double")):
+            p_rep = "< tuple with {} elements >".format(str(len(prop_value)))
+        # string
+        elif p_typ == "string" and isinstance(prop_value, str):
+            p_rep = "'{}'".format(prop_value[:_REPR_LIMIT])
+        # bool
+        elif p_typ == "boolean" and prop_value == 0:
+            p_rep = "False"
+        # pyuno object and the rest
+        else:
+            p_rep = _REPR.str(prop_value)
+            p_rep = p_rep.replace("\n", "'\n'")
+
+        return _cut(p_rep)
+
+    def summarize(self, object):
+        """Summarize sequence of scalars, eg. DataArray, FormulaArray
+
+        Called on demand, by the Summarize action of the workspace.
+        Statistics are computed with numpy in one vectorised pass, if
+        numpy is installed and the elements are strings, numbers or None.
+
+        :param object: list or tuple, of rows for two dimensions
+        Return dict with
+            'shape': list of dimensions
+            'dtype': numpy type of the elements, 'object' for mixed
+            'min', 'max', 'mean': of the numbers or None
+            'numbers', 'empty', 'nulls': count of numbers, empty
+                                         strings, None and NaN
+            'head', 'tail': repr of the first and last elements
+        """
+        n = len(object)
+        summary = {
+            "shape": [n],
+            "dtype": "object",
+            "min": None,
+            "max": None,
+            "mean": None,
+            "numbers": None,
+            "empty": None,
+            "nulls": None,
+            "head": [_REPR.repr(item) for item in object[:_SUMMARY_HEAD]],
+            "tail": [_REPR.repr(item) for item in object[max(_SUMMARY_HEAD, n - _SUMMARY_HEAD) :]],
+        }
+        if numpy is None or not n:
+            return summary
+
+        # rows of equal length
+        if isinstance(object[0], (list, tuple)):
+            width = len(object[0])
+            if not all(isinstance(row, (list, tuple)) and len(row) == width for row in object):
+                return summary
+            cells = list(chain.from_iterable(object))
+            shape = [n, width]
+        else:
+            cells = list(object)
+            shape = [n]
+        if len(cells) > _SUMMARY_MAX_CELLS:
+            return summary
+
+        # fast path, numbers and None only, numpy would convert
+        # numeric strings too
+        try:
+            numbers = numpy.asarray(cells, dtype=float)
+        except (TypeError, ValueError):
+            numbers = None
+        if numbers is not None and str not in set(map(type, cells)):
+            dtype = str(numbers.dtype)
+            empty = nulls = 0
+        else:
+            # numpy would take sequences and UNO objects apart
+            if not all(isinstance(cell, _SCALAR_TYPES) for cell in cells):
+                return summary
+
+            cells = numpy.array(cells, dtype="O")
+            texts = numpy.frompyfunc(lambda cell: isinstance(cell, str), 1, 1)(cells).astype(bool)
+            isnull = numpy.equal(cells, None)
+            # object dtype for ints beyond int64
+            numbers = numpy.array(cells[~texts & ~isnull].tolist())
+            if texts.all():
+                dtype = "str"
+            elif numbers.size == cells.size:
+                dtype = str(numbers.dtype)
+            else:
+                dtype = "object"
+            empty = numpy.count_nonzero(cells[texts] == "")
+            nulls = isnull.sum()
+
+        nans = numpy.isnan(numbers) if numbers.dtype.kind == "f" else numpy.zeros(numbers.shape, bool)
+        valid = numbers[~nans]
+
+        summary.update(
+            shape=shape,
+            dtype=dtype,
+            numbers=int(valid.size),
+            empty=int(empty),
+            nulls=int(nulls + nans.sum()),
+        )
+        if valid.size:
+            summary.update(
+                min=_scalar(valid.min()), max=_scalar(valid.max()), mean=float(valid.mean())
+            )
+
+        return summary
+
+    def _usedEnd(self, object):
+        """Return last row and column of the used area of the sheet
+
+        :param object: cell range or sheet
+        Return (row, column) zero based, None if the sheet has no cursor
+
+        """
+        try:
+            cursor = object.getSpreadsheet().createCursor()
+            cursor.gotoEndOfUsedArea(False)
+            address = cursor.getRangeAddress()
+        except _DisposedException:
+            raise
+        except Exception as err:
+            if _DEBUG:
+                print(err)
+            return None
+        return address.EndRow, address.EndColumn
+
+    def rangeInfo(self, object):
+        """Return size and position of cell range with XCellRangeData
+
+        The range is clamped to the used area of its sheet, so whole
+        sheets, columns and rows have the size of their content.
+
+        :param object: cell range, eg. sheet.getCellRangeByName('A1:D100')
+        Return dict with 'rows', 'columns', 'row', 'column' of the first
+        cell, zero based
+
+        """
+        address = object.getRangeAddress()
+        end_row, end_column = address.EndRow, address.EndColumn
+        used = self._usedEnd(object)
+        if used is not None:
+            end_row = min(end_row, used[0])
+            end_column = min(end_column, used[1])
+        return {
+            "rows": max(0, end_row - address.StartRow + 1),
+            "columns": max(0, end_column - address.StartColumn + 1),
+            "row": address.StartRow,
+            "column": address.StartColumn,
+        }
+
+    def rangeBlock(self, object, start, count=_RANGE_BLOCK, formulas=False):
+        """Read block of rows of cell range in one call
+
+        :param object: cell range with XCellRangeData
+        :param start: first row, relative to the range
+        :param count: number of rows
+        :param formulas: read getFormulaArray instead of getDataArray
+        Return dict with 'start' and 'rows', list of rows of cell texts
+
+        """
+        info = self.rangeInfo(object)
+        end = min(start + count, info["rows"])
+        if start >= end or not info["columns"]:
+            return {"start": start, "rows": []}
+
+        block = object.getCellRangeByPosition(0, start, info["columns"] - 1, end - 1)
+        if formulas:
+            data = block.getFormulaArray()
+        else:
+            data = block.getDataArray()
+
+        rows = []
+        for row in data:
+            cells = []
+            for cell in row:
+                # whole numbers without decimals, as Calc shows them
+                if isinstance(cell, float) and cell.is_integer():
+                    cell = int(cell)
+                cells.append(_cut(_REPR.str(cell)))
+            rows.append(cells)
+        return {"start": start, "rows": rows}
+
+    def _valueNames(self, properties, values):
+        """Return names of the properties whose values are fetched
+
+        :param properties: schema properties
+        :param values: 'eager' or 'lazy', see _inspectProperties
+
+        """
+        if values == "lazy":
+            return [p[0] for p in properties if p[0] in _EAGER_PROPERTIES]
+        return [p[0] for p in properties]
+
+    def _inspectProperties(self, object, schema=None, values="eager", fetched=None):
+        """Inspect properties
+
+        :param object: Inspect properties for object
+        :param schema: object schema, introspect object if None
+        :param values:  'eager': fetch all property values, default
+                        'lazy': fetch only names and types, property
+                        repr is LAZY_REPR, see inspectValues
+        :param fetched: property values and errors, see _fetchValues,
+                        fetched here if None
+
+        """
+
+        P = {}
+        if schema is None:
+            schema = self._inspectSchema(object)
+        if not schema:
+            return P
+
+        if fetched is None:
+            fetch = self._valueNames(schema["properties"], values)
+            fetched = self._fetchValues(object, schema, fetch)
+        prop_values, errors = fetched
+
+        for p_name, p_typ, p_display in schema["properties"]:
+            P[p_name] = {}
+            # description
+            P[p_name]["desc"] = "uno_property"
+            # type
+            P[p_name]["type"] = p_display
+
+            # repr
+            if p_name in errors:
+                P[p_name]["repr"] = "< Error property: " + str(errors[p_name]) + " >"
+            elif p_name not in prop_values:
+                P[p_name]["repr"] = LAZY_REPR
+            else:
+                try:
+                    P[p_name]["repr"] = self._propertyRepr(prop_values[p_name], p_typ)
+                except Exception as err:
+                    P[p_name]["repr"] = "< Error property: " + str(err) + " >"
+
+            P[p_name]["items"] = []
+
+        return P
+
+    def inspectValues(self, object, names):
+        """Return representation of selected property values
+
+        Complement to inspect(object, values='lazy'), the values are
+        fetched only for the properties the caller displays.
+
+        :param object: UNO object
+        :param names: property names
+        Return dict property name: repr
+
+        """
+        V = {}
+        schema = self._inspectSchema(object)
+        if not schema:
+            return V
+
+        types = {p_name: p_typ for p_name, p_typ, p_display in schema["properties"]}
+        names = [p_name for p_name in names if p_name in types]
+        prop_values, errors = self._fetchValues(object, schema, names)
+
+        for p_name in names:
+            if p_name in errors:
+                V[p_name] = "< Error property: " + str(errors[p_name]) + " >"
+                continue
+            try:
+                V[p_name] = self._propertyRepr(prop_values[p_name], types[p_name])
+            except Exception as err:
+                V[p_name] = "< Error property: " + str(err) + " >"
+
+        return V
+
+    def _inspectMethods(self, object, schema=None):
+        """Inspect methods
+
+        :param object: Inspect methods for object
+        :param schema: object schema, introspect object if None
+
+        """
+
+        M = {}
+        if schema is None:
+            schema = self._inspectSchema(object)
+        if not schema:
+            return M
+
+        def query(m_name):
+            _checkCancelled(1)
+            start = time.perf_counter()
+            try:
+                return self._methodItems(object, m_name), None
+            except Exception as err:
+                return None, err
+            finally:
+                self._member(m_name, start)
+
+        queries = [m[0] for m in schema["methods"] if m[0] in _ITEM_METHODS]
+        pages = dict(zip(queries, self._map(query, queries)))
+
+        for m_name, m_typ, params in schema["methods"]:
+            try:
+                M[m_name] = {}
+                # description
+                M[m_name]["desc"] = "uno_method"
+                # type
+                M[m_name]["type"] = m_typ
+
+                # items
+                if m_name in pages:
+                    page, err = pages[m_name]
+                    if err is not None:
+                        raise err
+                    M[m_name].update(page)
+                else:
+                    M[m_name]["items"] = []
+
+                # repr
+                M[m_name]["repr"] = params
             except Exception as err:
                 # M[m_name] = {}
                 M[m_name]["type"] = "ERROR"
@@ -252,57 +1102,256 @@ class Inspector:
 
         return M
 
-    def _inspectPython(self, object):
+    def _methodItems(self, object, m_name):
+        """List items of method
 
-        """Inspect standard Python
+        :param object: UNO object
+        :param m_name: method name in _ITEM_METHODS
+        Return dict with 'items', 'more' for paged items
 
-        :param object: Inspect attrbutes for object
+        """
+        # name access, index access, enumerate
+        if m_name in ("getByName", "getByIndex", "createEnumeration"):
+            return self.listItems(object, m_name)
+
+        # supported services
+        with self._phase("services"):
+            items = object.getSupportedServiceNames()
+        return {"items": sorted(items)}
+
+    def _continue(self, page, *args):
+        """Store page function and arguments of the next page
+
+        Return continuation token
 
         """
+        token = str(next(_TOKENS))
+        _CONTINUATIONS.put(token, (page,) + args)
+        return token
 
-        S = {}
-        name = "ERROR"
-        try:
+    def _namesPage(self, names, start, count):
+        """List page of sorted element names
 
-            for name in dir(object):
-                if name.startswith("__"):
-                    continue
+        :param names: sorted names
+        :param start: index of the first listed name
+        :param count: maximum number of listed names
 
-                atr = getattr(object, name)
+        """
+        end = start + count
+        more = self._continue(self._namesPage, names, end, count) if end < len(names) else None
+        return {"items": names[start:end], "more": more}
 
-                # name
-                S[name] = {}
+    def _indexPage(self, total, start, count):
+        """List page of indexes
 
-                # description
-                S[name]["desc"] = "python"
+        :param total: number of elements
+        :param start: first listed index
+        :param count: maximum number of listed indexes
 
-                # type
-                typ = str(type(atr))
-                typ = typ.replace("<class ", "").replace(">", "")
-                typ = typ.replace("'", "")
+        """
+        end = min(start + count, total)
+        more = self._continue(self._indexPage, total, end, count) if end < total else None
+        return {"items": [str(item) for item in range(start, end)], "more": more}
 
-                # repr
-                if typ == "dict":
-                    t = "< dict with {} elements >".format(str(len(repr(atr))))
-                else:
-                    t = repr(atr)
+    def _enumerationPage(self, enm, start, count):
+        """List page of enumeration indexes
+
+        The enumeration is advanced only for listed items, elements are
+        not converted. If the enumeration has more elements it is kept
+        for moreItems.
 
-                S[name]["type"] = typ
-                S[name]["repr"] = t
-                all_items = []
-                S[name]["items"] = all_items
+        :param enm: XEnumeration
+        :param start: index of the next element
+        :param count: maximum number of listed indexes
 
+        """
+        items = []
+        deadline = time.perf_counter() + self.time_budget
+        e = start
+        with self._phase("enumeration"):
+            while enm.hasMoreElements():
+                _checkCancelled(1)
+                if items and (len(items) >= count or time.perf_counter() > deadline):
+                    more = self._continue(self._enumerationPage, enm, e, count)
+                    return {"items": items, "more": more}
+                enm.nextElement()
+                items.append(str(e))
+                e = e + 1
+
+        return {"items": items, "more": None}
+
+    def listItems(self, object, method, start=0, count=None, prefix=""):
+        """List items of name, index or enumeration access page by page
+
+        :param object: UNO object
+        :param method:  'getByName': element names, sorted
+                        'getByIndex': element indexes
+                        'createEnumeration': enumeration indexes
+        :param start: index of the first listed item
+        :param count: maximum number of items, default page_size
+        :param prefix: list only names starting with prefix
+        Return dict with 'items' and 'more' continuation token or None
+
+        """
+        if count is None:
+            count = self.page_size
+
+        if method == "getByName":
+            with self._phase("names"):
+                element_names = object.getElementNames()
+            with self._phase("sort"):
+                # escape bytes
+                names = sorted(str(item) for item in element_names)
+                if prefix:
+                    names = [name for name in names if name.startswith(prefix)]
+            return self._namesPage(names, start, count)
+
+        elif method == "getByIndex":
+            with self._phase("indexes"):
+                total = object.getCount()
+            return self._indexPage(total, start, count)
+
+        elif method == "createEnumeration":
+            with self._phase("enumeration"):
+                enm = object.createEnumeration()
+                for e in range(start):
+                    _checkCancelled(1)
+                    if not enm.hasMoreElements():
+                        break
+                    enm.nextElement()
+            return self._enumerationPage(enm, start, count)
+
+        return {"items": [], "more": None}
+
+    def moreItems(self, token):
+        """List next page of items
+
+        :param token: continuation token returned with the previous page
+        Return dict with 'items' and 'more' continuation token or None
+
+        """
+        state = _CONTINUATIONS.pop(token)
+        if state is None:
+            return {"items": [], "more": None}
+
+        page, *args = state
+        return page(*args)
+
+    def _pythonEntry(self, value):
+        """Return entry of Python value
+
+        :param value: attribute value or namespace variable
+
+        """
+        # type
+        typ = str(type(value))
+        typ = typ.replace("<class ", "").replace(">", "")
+        typ = typ.replace("'", "")
+
+        # repr
+        if typ == "dict":
+            t = "< dict with {} elements >".format(str(len(value)))
+        else:
+            t = _REPR.repr(value)
+
+        return {
+            "desc": "python",
+            "kind": _kind(value),
+            "type": typ,
+            "repr": t,
+            "items": [],
+        }
+
+    def _inspectPython(self, object, skip=()):
+
+        """Inspect standard Python
+
+        Mappings are inspected by keys, other objects by attributes.
+
+        :param object: Inspect attrbutes for object
+        :param skip: names left out, eg. the inspected UNO members
+
+        """
+
+        S = {}
+        if isinstance(object, Mapping):
+            try:
+                keys = list(object.keys())
+            except Exception as err:
+                if _DEBUG:
+                    print(err)
+                keys = []
+            for key in keys:
+                try:
+                    S["[" + repr(key) + "]"] = self._pythonEntry(object[key])
+                except Exception as err:
+                    if _DEBUG:
+                        print(err)
+            return S
+
+        try:
+            names = dir(object)
         except Exception as err:
             if _DEBUG:
                 print(err)
+            return S
+
+        for name in names:
+            if name.startswith("__") or name in skip:
+                continue
+            try:
+                S[name] = self._pythonEntry(getattr(object, name))
+            except Exception as err:
+                S[name] = {
+                    "desc": "python",
+                    "type": "ERROR",
+                    "repr": "< Error attribute: " + str(err) + " >",
+                    "items": [],
+                }
 
         return S
 
-    def _inspectPropertyValue(self, object):
+    def iterNamespace(self, namespace=None, batch_size=_BATCH_SIZE):
+        """Inspect variables of namespace, as pyzo's workspace
+
+        :param namespace: namespace dict, default the shell's, see
+                          _namespace
+        :param batch_size: number of entries per batch
+        Yield lists of (name, entry)
+
+        """
+        if namespace is None:
+            namespace = _namespace()
+
+        S = {}
+        with self._phase("python"):
+            for name, value in list(namespace.items()):
+                name = str(name)
+                if name.startswith("__"):
+                    continue
+                try:
+                    S[name] = self._pythonEntry(value)
+                except Exception as err:
+                    if _DEBUG:
+                        print(err)
+
+        entries = sorted(S.items())
+        for i in range(0, len(entries), batch_size):
+            yield entries[i : i + batch_size]
+
+    def _inspectPropertyValue(self, object, start=0, count=None):
+        """Inspect elements of sequence
+
+        :param object: list or tuple
+        :param start: index of the first inspected element
+        :param count: number of inspected elements, default all
+
+        """
         V = {}
         if isinstance(object, (list, tuple)):
+            end = len(object) if count is None else start + count
             try:
-                for idx, item in enumerate(object):
+                for idx, item in enumerate(object[start:end], start):
                     idx = "[" + str(idx) + "]"
                     typ = str(type(item))
                     typ = typ.replace("<class ", "").replace(">", "")
@@ -310,15 +1359,16 @@ class Inspector:
                         "pyzokernel.introspection.", ""
                     )
                     typ = typ.replace("'", "")
-                    t = str(item)
+                    t = _REPR.str(item)
                     t = t.replace("(com.sun.star.beans.PropertyValue)", "")
                     if t.startswith("pyuno object"):
                         t = item.ImplementationName
                     #
                     V[idx] = {}
                     V[idx]["desc"] = "uno_property"
+                    V[idx]["kind"] = _kind(item)
                     V[idx]["type"] = typ
-                    V[idx]["repr"] = t
+                    V[idx]["repr"] = _cut(t)
                     V[idx]["items"] = []
             except Exception as err:
                 if _DEBUG:
@@ -326,55 +1376,283 @@ class Inspector:
 
         return V
 
-    def inspect(self, object, output="json"):
+    def resolve(self, path, namespace=None, refresh=False):
+        """Evaluate object path using the handles of the navigated paths
+
+        The steps before the last one are taken from the handle table if
+        they are there, the last step is evaluated on the handle of its
+        parent, so going down or back one step costs one step and calls
+        like getCurrentSelection() return the current object. Handles are
+        valid while the root name refers to the same object.
+
+        :param path: object expression eg. 'doc.Sheets.getByIndex(0)'
+        :param namespace: namespace of the root name, default the
+                          shell's, see _namespace
+        :param refresh: evaluate all steps again
+        Return object
+
+        """
+        if namespace is None:
+            namespace = _namespace()
+
+        return self._resolve(path, namespace, refresh)[1]
+
+    def _resolve(self, path, namespace, refresh, last=True):
+        """Return root object and object for path
+
+        The handle of the last step is used only if last is False, for
+        prefixes of the requested path.
+        """
+        root, steps = _splitPath(path)
+
+        # enumerated objects eg. list(document.Text)
+        if root.startswith("list(") and root.endswith(")"):
+            anchor, inner = self._resolve(root[5:-1], namespace, refresh, False)
+            entry = _HANDLES.get(root)
+            reuse = not refresh and (steps or not last)
+            if entry is not None and entry[0] is anchor and reuse:
+                object = entry[1]
+            else:
+                object = list(inner)
+                _HANDLES.put(root, (anchor, object))
+        else:
+            anchor = object = eval(root, namespace)
+
+        key = root
+        for i, step in enumerate(steps):
+            key = key + step
+            entry = _HANDLES.get(key)
+            reuse = not refresh and (i < len(steps) - 1 or not last)
+            if entry is not None and entry[0] is anchor and reuse:
+                object = entry[1]
+            else:
+                _checkCancelled(1)
+                object = eval("_pyuno_parent" + step, namespace, {"_pyuno_parent": object})
+                _HANDLES.put(key, (anchor, object))
+
+        return anchor, object
+
+    def clearHandles(self):
+        """Remove all object handles of the navigated paths
+        """
+        _HANDLES.clear()
+
+    def inspectPath(self, path, refresh=False, **kwargs):
+        """Inspect object of path, see resolve and inspect
+
+        :param path: object expression
+        :param refresh: evaluate all steps of path again
+        :param kwargs: inspect arguments
+
+        """
+        return self.inspect(self.resolve(path, refresh=refresh), **kwargs)
+
+    def iterInspect(self, object, values="eager", batch_size=_BATCH_SIZE, uno=True):
+        """Inspect object, yield entries as they are resolved
+
+        Properties and methods of UNO object are yielded in batches of
+        batch_size entries, sorted by name, properties first, then its
+        other Python attributes in one batch. The property values are
+        fetched at once before the first batch, in one bulk call.
+        Elements of sequences are yielded in batches of batch_size,
+        other objects in one batch.
+
+        :param object:  Inspect this object
+        :param values:  'eager': fetch property values, default
+                        'lazy': skip property values, see inspectValues
+        :param batch_size: number of entries per batch
+        :param uno: inspect UNO members, False for Python attributes only
+        Yield lists of (name, entry)
+
+        """
+        if object is None:
+            return
+
+        # inspect UNO properties and methods
+        uno = uno and self.introspection is not None
+        schema = self._inspectSchema(object) if uno else None
+
+        # UNO object
+        if schema and schema["properties"] and schema["methods"]:
+            with self._phase("sort"):
+                properties = sorted(schema["properties"])
+                methods = sorted(schema["methods"])
+
+            fetch = self._valueNames(properties, values)
+            fetched = self._fetchValues(object, schema, fetch)
+            for i in range(0, len(properties), batch_size):
+                _checkCancelled()
+                part = dict(schema, properties=properties[i : i + batch_size])
+                p = self._inspectProperties(object, part, values, fetched)
+                yield sorted(p.items())
+
+            for i in range(0, len(methods), batch_size):
+                _checkCancelled()
+                part = dict(schema, methods=methods[i : i + batch_size])
+                m = self._inspectMethods(object, part)
+                yield sorted(m.items())
+
+            # attributes which are not UNO members, without bridge calls
+            # for the members
+            members = {p[0] for p in properties}
+            members.update(m[0] for m in methods)
+            with self._phase("python"):
+                s = self._inspectPython(object, skip=members)
+            if s:
+                yield sorted(s.items())
+            return
+
+        # sequence, element rows page by page
+        if isinstance(object, (list, tuple)) and object:
+            for i in range(0, len(object), batch_size):
+                _checkCancelled()
+                with self._phase("python"):
+                    v = self._inspectPropertyValue(object, i, batch_size)
+                if v:
+                    yield sorted(v.items())
+            return
+
+        # not UNO object - try python
+        with self._phase("python"):
+            s = self._inspectPython(object)
+        if s:
+            yield sorted(s.items())
+
+    def _streamPage(self, batches, request, first=True):
+        """Return next batches of streamed inspection in compact form
+
+        The first page has one batch, so the rows are shown soon, the
+        next pages collect the batches made within time_budget, so the
+        rest comes with few round-trips.
+        """
+        deadline = time.perf_counter() + self.time_budget
+        entries = {}
+        done = False
+        while True:
+            batch = next(batches, None)
+            if batch is None:
+                done = True
+                break
+            entries.update(batch)
+            if first or time.perf_counter() > deadline:
+                break
+
+        result = compact(entries, request)
+        result["more"] = None
+        if not done:
+            result["more"] = str(next(_TOKENS))
+            _STREAMS.put(result["more"], (batches, request))
+        elif self._stats is not None:
+            result["stats"] = self._stats.result(members=False)
+        return result
+
+    def streamPath(
+        self, path, refresh=False, values="eager", request=None, stats=None, uno=True
+    ):
+        """Inspect object of path batch by batch
+
+        :param path: object expression, see resolve, '' for the
+                     variables of the shell
+        :param refresh: evaluate all steps of path again
+        :param values: 'eager' or 'lazy', see inspect
+        :param request: request id returned with each batch
+        :param stats: record stats of this inspection, default self.stats
+        :param uno: inspect UNO members, see iterInspect
+        Return first batch in compact form, see compact, with 'more'
+        continuation token for moreBatch or None, the last batch has
+        'stats' if stats are enabled
+
+        """
+        # a new inspection of the workspace supersedes the open ones
+        _STREAMS.clear()
+        if stats is not None:
+            self.stats = stats
+        self._startStats()
+        if not path:
+            return self._streamPage(self.iterNamespace(), request)
+        object = self.resolve(path, refresh=refresh)
+        return self._streamPage(self.iterInspect(object, values, uno=uno), request)
+
+    def moreBatch(self, token, request=None):
+        """Return next batches of streamed inspection, see streamPath
+
+        :param token: continuation token returned with the previous batch
+        :param request: request id of the inspection
+        Return batch in compact form, see compact, with 'more'
+        continuation token or None, and 'lost' True if the inspection
+        is not open any more
+
+        """
+        state = _STREAMS.pop(token)
+        if state is None:
+            return {
+                "request": request,
+                "rows": [],
+                "items": {},
+                "more": None,
+                "lost": True,
+            }
+
+        batches, request = state
+        return self._streamPage(batches, request, first=False)
+
+    def inspect(self, object, output="json", values="eager", request=None):
         """Inspect object
         :param object:  Inspect this object
         :param output:  'console': display result in terminal
                         'dict': return dict
+                        'compact': return compact dict, see compact
                         'json': store result in json file, default
                         'pickle': store result in pickle file
+        :param values:  'eager': fetch property values, default
+                        'lazy': skip property values, see inspectValues
+        :param request: request id returned in compact result
         Store result files (json, pickle) in unoinspect.py directory
-        Return properties and methods
+        Return properties and methods, with '_stats' (compact: 'stats')
+        if stats are enabled, see _Stats.result
         """
         # store result in dictionary
         context = {}
 
-        if object is None:
+        if object is None and output != "compact":
             return context
-        else:
-            # inspect UNO properties and methods
-            p = self._inspectProperties(object)
-            m = self._inspectMethods(object)
-
-            # UNO object
-            if p and m:
-                context.update(sorted(p.items()))
-                context.update(sorted(m.items()))
-            else:
-                v = self._inspectPropertyValue(object)
-                if v:
-                    context.update(sorted(v.items()))
 
-            # not UNO object - try python
-            if not context:
-                s = self._inspectPython(object)
-                if s:
-                    context.update(sorted(s.items()))
+        self._startStats()
+        # one batch, so the property values are fetched in one bulk call
+        for batch in self.iterInspect(object, values, batch_size=sys.maxsize):
+            context.update(batch)
+
+        stats = self._stats
+        if stats is not None and output != "compact":
+            context["_stats"] = stats.result()
 
         # display result in terminal
         if output == "console":
             for key, value in context.items():
+                if key == "_stats":
+                    continue
                 # print('KEY: ' + str(key))
                 # print('VALUE: ' + str(value))
                 for tp, rep in value.items():
                     t = context[key]["type"]
                     r = context[key]["repr"]
                 print("{:<35}".format(key) + "{:<35}".format(t) + r)
+            if stats is not None:
+                for name, t, calls in context["_stats"]["slowest"]:
+                    print("{:<35}{:<35}{:.6f}".format(name, calls, t))
 
         # return dict
         elif output == "dict":
             return context
 
+        # return compact dict
+        elif output == "compact":
+            with self._phase("output"):
+                result = compact(context, request)
+            if stats is not None:
+                result["stats"] = stats.result(members=False)
+            return result
+
         # pickle
         elif output == "pickle":
             file_path = join(_DIR, _PICKLE_FILE)
@@ -382,7 +1660,7 @@ class Inspector:
             if exists(file_path):
                 os.remove(file_path)
 
-            with open(file_path, "wb") as outfile:
+            with self._phase("output"), open(file_path, "wb") as outfile:
                 pickle.dump(context, outfile)
 
         # store result in json file
@@ -392,7 +1670,7 @@ class Inspector:
             if exists(file_path):
                 os.remove(file_path)
 
-            with open(file_path, "w") as outfile:
+            with self._phase("output"), open(file_path, "w") as outfile:
                 dump(context, outfile, indent=4)
 
     def showServiceDocs(self, object):
@@ -415,3 +1693,350 @@ class Inspector:
 
         return pathJSON, pathPICKLE
 
+
+# -----------------------------------------------------------
+#               SESSION
+# -----------------------------------------------------------
+
+
+class _Job:
+    """Call queued for the session worker"""
+
+    def __init__(self, id, func, calls=None):
+        self.id = id
+        self.func = func
+        self.cancel = threading.Event()
+        # bridge call budget or None
+        self.calls = calls
+        self.lock = threading.Lock()
+        self.done = False
+        self.result = None
+        self.error = None
+
+
+class InspectionSession:
+    """Inspection state which lives as long as the kernel
+
+    The workspace sends its requests to the session of the kernel, see
+    getSession, instead of creating an Inspector for each request. The
+    session owns the Inspector with the introspection, reflection and
+    documenter singletons; object schemas, item continuations and
+    handles are kept in the module. When the bridge is disposed the
+    session starts again with new singletons and empty caches.
+
+    Jobs submitted with submit and submitPath run one after another on
+    the worker thread of the session, so a slow inspection keeps
+    neither the user's shell nor the pyzo request channel busy. The
+    caller polls for the results and can cancel jobs, a running job
+    stops at the next check between batches or enumerated elements.
+    Prefetches wait until no other job is queued.
+
+    """
+
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: Inspector arguments
+        """
+        self._kwargs = kwargs
+        self.inspector = Inspector(**kwargs)
+
+        # jobs by id, queued jobs and worker thread
+        self._jobs = _LRUCache(_JOB_CACHE_SIZE)
+        self._job_ids = count(1)
+        self._queue = queue.PriorityQueue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """Create new Inspector, remove cached schemas, listings and handles
+        """
+        _SCHEMA_CACHE.clear()
+        _CONTINUATIONS.clear()
+        _STREAMS.clear()
+        _HANDLES.clear()
+        self.inspector.close()
+        self.inspector = Inspector(**self._kwargs)
+
+    def run(self, method, *args, **kwargs):
+        """Call Inspector method
+
+        Reset the session and call once more if the bridge is disposed.
+
+        :param method: Inspector method name eg. 'streamPath'
+        Return result of the method
+        """
+        try:
+            return getattr(self.inspector, method)(*args, **kwargs)
+        except _DisposedException as err:
+            if _DEBUG:
+                print(err)
+            self.reset()
+            return getattr(self.inspector, method)(*args, **kwargs)
+
+    def runPath(self, method, path, *args, **kwargs):
+        """Call Inspector method with the object of path, see resolve
+
+        :param method: Inspector method name eg. 'inspectValues'
+        :param path: object expression
+        Return result of the method
+        """
+
+        def call():
+            object = self.inspector.resolve(path)
+            return getattr(self.inspector, method)(object, *args, **kwargs)
+
+        try:
+            return call()
+        except _DisposedException as err:
+            if _DEBUG:
+                print(err)
+            self.reset()
+            return call()
+
+    def _submit(self, func, idle=False, calls=None):
+        """Queue func for the worker thread, start the worker if needed
+
+        :param idle: run after all queued jobs which are not idle
+        :param calls: bridge call budget, see _checkCancelled
+        Return job id
+        """
+        job = _Job(next(self._job_ids), func, calls)
+        self._jobs.put(job.id, job)
+        self._queue.put((1 if idle else 0, job.id, job))
+
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._work, name="unoinspect-session", daemon=True
+                )
+                self._worker.start()
+
+        return job.id
+
+    def _work(self):
+        """Run queued jobs, the loop of the worker thread
+        """
+        while True:
+            priority, id, job = self._queue.get()
+            if job.cancel.is_set():
+                job.error = "cancelled"
+                job.done = True
+                continue
+            _JOB.job = job
+            try:
+                job.result = job.func()
+            except _Cancelled as err:
+                job.error = str(err)
+            except BaseException as err:
+                # also SystemExit of inspected code, the worker goes on
+                # and the job is polled as failed
+                job.error = str(err) or type(err).__name__
+            finally:
+                _JOB.job = None
+                job.done = True
+
+    def submit(self, method, *args, **kwargs):
+        """Run Inspector method on the worker thread, see run
+
+        Return job id for poll and cancel
+        """
+        return self._submit(lambda: self.run(method, *args, **kwargs))
+
+    def submitPath(self, method, path, *args, **kwargs):
+        """Run Inspector method with the object of path on the worker
+        thread, see runPath
+
+        Return job id for poll and cancel
+        """
+        return self._submit(lambda: self.runPath(method, path, *args, **kwargs))
+
+    def prefetch(self, path, calls=_PREFETCH_CALLS, request=None):
+        """Inspect object of path on the worker thread when no other job
+        is queued, for the cache of the workspace
+
+        Property values are left out, see inspect(values='lazy'). The
+        job stops with error 'budget' when the inspection would make
+        more than calls bridge calls.
+
+        :param path: object expression, see resolve
+        :param calls: bridge call budget
+        :param request: request id returned with the result
+        Return job id for poll and cancel
+        """
+
+        def call():
+            return self.run(
+                "inspectPath", path, output="compact", values="lazy", request=request
+            )
+
+        return self._submit(call, idle=True, calls=calls)
+
+    def poll(self, ids):
+        """Return finished jobs and forget them
+
+        :param ids: job ids
+        Return list of dicts with 'job', 'result' and 'error', error is
+        'cancelled' for cancelled jobs, 'budget' for prefetches over
+        budget and 'unknown' for forgotten ids
+        """
+        finished = []
+        for id in ids:
+            job = self._jobs.get(id)
+            if job is None:
+                finished.append({"job": id, "result": None, "error": "unknown"})
+            elif job.done:
+                self._jobs.pop(id)
+                finished.append({"job": id, "result": job.result, "error": job.error})
+        return finished
+
+    def cancel(self, ids):
+        """Cancel jobs, queued jobs do not run
+
+        :param ids: job ids
+        """
+        for id in ids:
+            job = self._jobs.pop(id)
+            if job is not None:
+                job.cancel.set()
+
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def getSession():
+    """Return inspection session of the kernel, created on first use
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = InspectionSession()
+        return _SESSION
+
+
+# -----------------------------------------------------------
+#               COMMAND LINE
+# -----------------------------------------------------------
+
+
+def connect(url=_URL):
+    """Connect to office process
+
+    Start the office in shell with command:
+    soffice "--accept=socket,host=localhost,port=2002,tcpNoDelay=1;urp;StarOffice.ComponentContext" --norestore
+
+    :param url: UNO URL of the office component context
+    Return remote component context
+    """
+    if uno is None:
+        raise RuntimeError(
+            "pyuno is required, run with the Python of the office or with "
+            "pyuno on the path"
+        )
+    local_ctx = uno.getComponentContext()
+    resolver = local_ctx.ServiceManager.createInstance(
+        "com.sun.star.bridge.UnoUrlResolver"
+    )
+    return resolver.resolve(url)
+
+
+def inspectExpressions(expressions, namespace, workers=_CLI_WORKERS, **kwargs):
+    """Inspect object expressions with a pool of workers
+
+    Every worker thread has its own Inspector, object schemas and
+    handles are shared by all. Items are listed completely, in one page
+    without continuation token.
+
+    :param expressions: object expressions eg. 'desktop.getCurrentComponent()'
+    :param namespace: names used by the expressions
+    :param workers: number of expressions inspected at once
+    :param kwargs: Inspector arguments
+    Yield dict with 'expression' and 'result' or 'error', in order
+    of expressions
+    """
+    local = threading.local()
+    inspectors = []
+    kwargs.setdefault("page_size", sys.maxsize)
+    kwargs.setdefault("time_budget", float("inf"))
+
+    def inspect(expression):
+        inspector = getattr(local, "inspector", None)
+        if inspector is None:
+            inspector = local.inspector = Inspector(**kwargs)
+            inspectors.append(inspector)
+        try:
+            object = inspector.resolve(expression, namespace)
+            result = inspector.inspect(object, output="dict")
+        except Exception as err:
+            return {"expression": expression, "error": str(err)}
+        # tokens mean nothing outside the process
+        for value in result.values():
+            if isinstance(value, dict):
+                value.pop("more", None)
+        return {"expression": expression, "result": result}
+
+    try:
+        with ThreadPoolExecutor(max(1, workers)) as executor:
+            for record in executor.map(inspect, expressions):
+                yield record
+    finally:
+        for inspector in inspectors:
+            inspector.close()
+
+
+def main(argv=None):
+    """Inspect object expressions of a file, write results as JSON Lines
+
+    python unoinspect.py expressions.txt -o result.jsonl
+
+    Run the file as script, importing the pyzoPyUNOWorkspace package
+    needs pyzo.
+
+    One expression per line, empty lines and lines starting with # are
+    skipped. Expressions can use ctx, smgr, desktop and uno.
+    """
+    parser = argparse.ArgumentParser(
+        description="Inspect UNO objects of a running office, write JSON Lines."
+    )
+    parser.add_argument(
+        "expressions", help="file with one object expression per line, - for stdin"
+    )
+    parser.add_argument("-o", "--output", default="-", help="JSON Lines file, - for stdout")
+    parser.add_argument("--url", default=_URL, help="UNO URL of the office")
+    parser.add_argument(
+        "--workers", type=int, default=_CLI_WORKERS, help="expressions inspected at once"
+    )
+    parser.add_argument("--stats", action="store_true", help="add timing stats")
+    args = parser.parse_args(argv)
+
+    try:
+        ctx = connect(args.url)
+    except Exception as err:
+        print(err, file=sys.stderr)
+        return 1
+
+    namespace = {
+        "ctx": ctx,
+        "smgr": ctx.ServiceManager,
+        "desktop": ctx.getByName("/singletons/com.sun.star.frame.theDesktop"),
+        "uno": uno,
+    }
+
+    infile = sys.stdin if args.expressions == "-" else open(args.expressions)
+    with infile:
+        expressions = [line.strip() for line in infile]
+    expressions = [e for e in expressions if e and not e.startswith("#")]
+
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w")
+    with outfile:
+        for record in inspectExpressions(
+            expressions, namespace, args.workers, ctx=ctx, stats=args.stats
+        ):
+            outfile.write(dumps(record) + "\n")
+            outfile.flush()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,45 @@
 # -*- coding: utf-8 -*-
 # PyUNO Workspace helper module
+from inspect import getsourcefile
 from re import findall
-from os.path import join
+from os.path import abspath, dirname, join
+
+
+# Kernel side inspection module, loaded by file path once per shell
+UNOINSPECT_PATH = join(dirname(abspath(getsourcefile(lambda: 0))), "unoinspect.py")
+UNOINSPECT_MODULE = "pyzo_unoinspect"
+_LOADER = (
+    "import importlib.util, sys\n"
+    "spec = importlib.util.spec_from_file_location({name!r}, {path!r})\n"
+    "module = importlib.util.module_from_spec(spec)\n"
+    "spec.loader.exec_module(module)\n"
+    "sys.modules[{name!r}] = module\n"
+).format(name=UNOINSPECT_MODULE, path=UNOINSPECT_PATH)
+# Inspection session of the kernel, see unoinspect.getSession
+SESSION = (
+    "(__import__('sys').modules.get({name!r}) or exec({loader!r}, {{}}) "
+    "or __import__('sys').modules[{name!r}]).getSession()"
+).format(name=UNOINSPECT_MODULE, loader=_LOADER)
+
+
+def _arguments(args, kwargs):
+    params = [repr(arg) for arg in args]
+    params.extend("{}={!r}".format(key, value) for key, value in kwargs.items())
+    return ", ".join(params)
+
+
+def sessionExpression(call, *args, **kwargs):
+    """ sessionExpression(call, *args, **kwargs)
+    Return kernel expression calling the session method, eg. 'poll'.
+    """
+    return "{}.{}({})".format(SESSION, call, _arguments(args, kwargs))
+
+
+def sessionCall(method, *args, **kwargs):
+    """ sessionCall(method, *args, **kwargs)
+    Return kernel expression calling the Inspector method in the session.
+    """
+    return "{}.run({})".format(SESSION, _arguments((method,) + args, kwargs))
 
 
 def splitName(name):